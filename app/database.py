@@ -1,7 +1,10 @@
 """Database configuration and session management."""
+import asyncio
+import logging
+from typing import AsyncGenerator, List
+from sqlalchemy import and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy.pool import NullPool
+from sqlalchemy.orm import DeclarativeBase, raiseload
 from app.config import settings
 
 
@@ -10,16 +13,25 @@ class Base(DeclarativeBase):
     pass
 
 
+# Keep per-statement engine logging off unless explicitly requested
+if not settings.sql_echo:
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+
 # Create async engine with proper connection pooling
 engine = create_async_engine(
     settings.database_url,
-    echo=settings.debug,
+    echo=settings.sql_echo,
     future=True,
-    poolclass=NullPool,  # Use NullPool to avoid connection pool issues
-    pool_pre_ping=True,  # Verify connections before use
-    pool_recycle=3600,   # Recycle connections every hour
+    pool_size=settings.pool_size,
+    max_overflow=settings.max_overflow,
+    pool_timeout=settings.pool_timeout,
+    pool_recycle=settings.pool_recycle,
+    pool_pre_ping=settings.pool_pre_ping,
 )
 
+# Set once the schema is in place; background loops wait on it before polling
+database_ready = asyncio.Event()
+
 # Create session factory
 async_session_factory = async_sessionmaker(
     engine,
@@ -28,10 +40,22 @@ async_session_factory = async_sessionmaker(
 )
 
 
-async def get_db_session() -> AsyncSession:
+async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """Get database session."""
-    session = async_session_factory()
-    try:
+    async with async_session_factory() as session:
         yield session
-    finally:
-        await session.close()
+
+
+def raiseload_options() -> List:
+    """Get loader options that forbid lazy loading of relationships not loaded explicitly."""
+    return [raiseload("*")] if settings.raiseload_enabled else []
+
+
+def keyset_before(sort_column, id_column, sort_value, id_value):
+    """Get "(sort_column, id_column) < (sort_value, id_value)" for descending keyset pages."""
+    # Expanded form: MySQL turns it into an index range over both columns
+    # even after equality filters, unlike the row constructor comparison
+    return or_(
+        sort_column < sort_value,
+        and_(sort_column == sort_value, id_column < id_value)
+    )
@@ -1,15 +1,20 @@
 """Main application entry point."""
 import logging
 import asyncio
+import random
 from contextlib import asynccontextmanager
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 from litestar import Litestar
 from litestar.config.cors import CORSConfig
+from litestar.di import Provide
 from litestar.static_files import StaticFilesConfig
 from litestar.contrib.jinja import JinjaTemplateEngine
 from litestar.template.config import TemplateConfig
+from sqlalchemy import inspect
 from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import configure_mappers
 from app.config import settings
-from app.database import engine, get_db_session
+from app.database import engine, get_db_session, database_ready
 from app.models import Base
 from app.routes.reports import ReportsController
 from app.routes.notebooks import NotebooksController
@@ -31,18 +36,51 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-async def wait_for_database(max_retries: int = 30, delay: float = 2.0):
-    """Wait for database to be ready with retry logic."""
+def create_missing_tables(conn) -> int:
+    """Create only tables that are missing, using a single reflection query."""
+    existing_tables = set(inspect(conn).get_table_names())
+    missing_tables = [
+        table for table in Base.metadata.sorted_tables
+        if table.name not in existing_tables
+    ]
+    if missing_tables:
+        Base.metadata.create_all(conn, tables=missing_tables, checkfirst=False)
+    return len(missing_tables)
+
+
+def create_missing_indexes(conn) -> int:
+    """Create model indexes missing from existing tables."""
+    # create_all skips existing tables, so indexes added to the models later
+    # would never reach deployed databases otherwise
+    inspector = inspect(conn)
+    existing_tables = set(inspector.get_table_names())
+    created = 0
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing_indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing_indexes:
+                index.create(conn)
+                created += 1
+    return created
+
+
+async def wait_for_database(max_retries: int = 30, base_delay: float = 0.1, max_delay: float = 5.0):
+    """Wait for database to be ready with exponential backoff."""
     for attempt in range(max_retries):
         try:
             async with engine.begin() as conn:
-                await conn.run_sync(Base.metadata.create_all)
-            logger.info("Database connection successful")
+                created = await conn.run_sync(create_missing_tables)
+                created_indexes = await conn.run_sync(create_missing_indexes)
+            logger.info(f"Database connection successful ({created} tables, {created_indexes} indexes created)")
+            database_ready.set()
             return
         except OperationalError as e:
             logger.warning(f"Database connection attempt {attempt + 1}/{max_retries} failed: {e}")
             if attempt < max_retries - 1:
-                await asyncio.sleep(delay)
+                delay = min(max_delay, base_delay * 2 ** attempt)
+                await asyncio.sleep(delay + random.uniform(0, 0.1))
             else:
                 logger.error("Failed to connect to database after all retries")
                 raise
@@ -54,14 +92,21 @@ async def lifespan(app: Litestar):
     # Startup
     logger.info("Starting Juport application...")
     
-    # Wait for database to be ready and create tables
-    await wait_for_database()
+    # Wait for database to be ready and create tables in the background
+    database_task = asyncio.create_task(wait_for_database())
     
-    # Start scheduler
-    await scheduler.start()
+    # Configure ORM mappers now rather than on the first request
+    configure_mappers()
     
-    # Start task worker
-    await task_worker.start()
+    # Compile templates now rather than on the first request
+    for template_name in jinja_env.list_templates(extensions=["html"]):
+        jinja_env.get_template(template_name)
+    
+    # Start scheduler and task worker
+    await asyncio.gather(scheduler.start(), task_worker.start())
+    
+    # Scheduler and worker loops hold off polling until the schema is ready
+    await database_task
     
     logger.info("Application started successfully")
     
@@ -69,8 +114,10 @@ async def lifespan(app: Litestar):
     
     # Shutdown
     logger.info("Shutting down Juport application...")
-    await scheduler.stop()
-    await task_worker.stop()
+    results = await asyncio.gather(scheduler.stop(), task_worker.stop(), return_exceptions=True)
+    for name, result in zip(("scheduler", "task worker"), results):
+        if isinstance(result, Exception):
+            logger.error(f"Error stopping {name}: {result}", exc_info=result)
     await engine.dispose()
     logger.info("Application shutdown complete")
 
@@ -88,10 +135,21 @@ static_files_config = StaticFilesConfig(
     path="/static",
 )
 
+# Single Jinja environment; compiled templates stay cached for the process
+# (the template set is fixed, so the cache is unbounded) and compiled
+# bytecode is shared on disk between workers and restarts.
+# Outside debug mode templates are not checked for changes on every render.
+jinja_env = Environment(
+    loader=FileSystemLoader("templates"),
+    autoescape=True,
+    auto_reload=settings.debug,
+    cache_size=-1,
+    bytecode_cache=FileSystemBytecodeCache(),
+)
+
 # Template configuration
 template_config = TemplateConfig(
-    directory="templates",
-    engine=JinjaTemplateEngine,
+    instance=JinjaTemplateEngine.from_environment(jinja_env),
 )
 
 # Create application
@@ -105,7 +163,7 @@ app = Litestar(
         SchedulesController,
         TasksController,
     ],
-    dependencies={"db_session": get_db_session},
+    dependencies={"db_session": Provide(get_db_session)},
     cors_config=cors_config,
     static_files_config=[static_files_config],
     template_config=template_config,
@@ -1,5 +1,5 @@
 """Database models."""
-from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -8,6 +8,12 @@ from app.database import Base
 class Report(Base):
     """Report configuration model."""
     __tablename__ = "reports"
+    __table_args__ = (
+        # Keyset pagination (created_at, id) for report listings
+        Index("ix_reports_created_at_id", "created_at", "id"),
+    )
+    # Load server-generated created_at/updated_at during flush
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False, index=True)
@@ -21,12 +27,22 @@ class Report(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     # Relationships
-    executions = relationship("ReportExecution", back_populates="report", cascade="all, delete-orphan")
+    executions = relationship(
+        "ReportExecution",
+        back_populates="report",
+        cascade="all, delete-orphan",
+        order_by="desc(ReportExecution.started_at)",
+    )
 
 
 class ReportExecution(Base):
     """Report execution result model."""
     __tablename__ = "report_executions"
+    __table_args__ = (
+        # Per-report keyset pagination; also serves report_id lookups
+        Index("ix_report_executions_report_started_id", "report_id", "started_at", "id"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(Integer, primary_key=True, index=True)
     report_id = Column(Integer, ForeignKey("reports.id"), nullable=False)
@@ -45,6 +61,14 @@ class ReportExecution(Base):
 class Schedule(Base):
     """Schedule configuration model for managing report schedules."""
     __tablename__ = "schedules"
+    __table_args__ = (
+        # Keyset pagination (created_at, id) for schedule listings
+        Index("ix_schedules_created_at_id", "created_at", "id"),
+        # Due/active schedules ordered by next run (scheduler, /active)
+        Index("ix_schedules_active_next_run", "is_active", "next_run"),
+    )
+    # Load server-generated created_at/updated_at during flush
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False, index=True)
@@ -66,6 +90,10 @@ class Schedule(Base):
 class ScheduleExecution(Base):
     """Schedule execution result model."""
     __tablename__ = "schedule_executions"
+    __table_args__ = (
+        # Per-schedule keyset pagination; also serves schedule_id lookups
+        Index("ix_schedule_executions_schedule_scheduled_id", "schedule_id", "scheduled_at", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     schedule_id = Column(Integer, ForeignKey("schedules.id"), nullable=False)
@@ -85,6 +113,14 @@ class ScheduleExecution(Base):
 class Task(Base):
     """Task queue model for background report execution."""
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Keyset pagination (created_at, id) for task listings
+        Index("ix_tasks_created_at_id", "created_at", "id"),
+        # Running tasks by start time (worker stuck-task check, /running)
+        Index("ix_tasks_status_started_at", "status", "started_at"),
+        # Finished tasks by completion time (cleanup-completed)
+        Index("ix_tasks_status_completed_at", "status", "completed_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     report_id = Column(Integer, ForeignKey("reports.id"), nullable=False)
@@ -103,3 +139,8 @@ class Task(Base):
     report = relationship("Report", backref="tasks")
     schedule = relationship("Schedule", backref="tasks")
     report_execution = relationship("ReportExecution", backref="tasks")
+
+
+# Pending task queue: status = ... ORDER BY priority DESC, created_at ASC
+# (mixed directions need the DESC key part; declared here to reference columns)
+Index("ix_tasks_status_priority_created_at", Task.status, Task.priority.desc(), Task.created_at)
@@ -1,11 +1,10 @@
 """Authentication routes."""
 import logging
-import secrets
 from typing import Optional
 from litestar import Controller, post, get, Request
 from litestar.response import Template, Response, Redirect
 from litestar.exceptions import ValidationException
-from app.services.auth import auth_service
+from app.services.auth import auth_service, SESSION_TTL
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -67,14 +66,14 @@ class AuthController(Controller):
                 )
             
             # Create session
-            session_id = secrets.token_urlsafe(32)
+            session_id = auth_service.create_session(user_info)
             
             # Set session cookie and redirect
             response = Redirect("/")
             response.set_cookie(
                 "session_id",
                 session_id,
-                max_age=86400,  # 24 hours
+                max_age=SESSION_TTL,
                 httponly=True,
                 secure=not settings.debug,
                 samesite="lax"
@@ -97,6 +96,10 @@ class AuthController(Controller):
     @get("/logout")
     async def logout(self, request: Request) -> Response:
         """Handle logout."""
+        session_id = request.cookies.get("session_id")
+        if session_id:
+            auth_service.delete_session(session_id)
+        
         response = Redirect("/")
         response.delete_cookie("session_id")
         logger.info("User logged out")
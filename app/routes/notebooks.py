@@ -1,9 +1,29 @@
 """Notebook management API routes."""
+import os
+import time
 from typing import List
 from litestar import Controller, get
-from app.services.notebook_executor import NotebookExecutor
+from pydantic import TypeAdapter
+from app.config import settings
+from app.services.notebook_executor import notebook_executor
 from app.schemas import NotebookInfo
 
+# Seconds a cached notebook listing stays valid while the directory is unchanged
+NOTEBOOK_LIST_TTL = 5.0
+
+_notebook_list_cache = {"mtime": None, "ttl_deadline": 0.0, "value": None}
+
+# Validate the whole listing in one call instead of per notebook
+_NOTEBOOK_LIST = TypeAdapter(List[NotebookInfo])
+
+
+def _notebooks_dir_mtime() -> float:
+    """Get modification time of the notebooks directory (0 if missing)."""
+    try:
+        return os.stat(settings.jupyter_notebooks_path).st_mtime
+    except OSError:
+        return 0.0
+
 
 class NotebooksController(Controller):
     """Controller for notebook management."""
@@ -13,15 +33,21 @@ class NotebooksController(Controller):
     @get("/")
     async def get_notebooks(self) -> List[NotebookInfo]:
         """Get list of available notebooks."""
-        executor = NotebookExecutor()
-        notebooks = await executor.get_notebook_list()
+        dir_mtime = _notebooks_dir_mtime()
+        if (
+            _notebook_list_cache["value"] is not None
+            and _notebook_list_cache["mtime"] == dir_mtime
+            and time.monotonic() < _notebook_list_cache["ttl_deadline"]
+        ):
+            return _notebook_list_cache["value"]
+        
+        notebooks = await notebook_executor.get_notebook_list()
+        
+        result = _NOTEBOOK_LIST.validate_python(notebooks)
         
-        return [
-            NotebookInfo(
-                name=notebook["name"],
-                path=notebook["path"],
-                size=notebook["size"],
-                modified=notebook["modified"]
-            )
-            for notebook in notebooks
-        ]
+        _notebook_list_cache.update(
+            mtime=dir_mtime,
+            ttl_deadline=time.monotonic() + NOTEBOOK_LIST_TTL,
+            value=result
+        )
+        return result
@@ -1,29 +1,113 @@
 """Report management API routes."""
 import json
 import logging
+import time
 from datetime import datetime
-from typing import List, Optional, Union
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
 from litestar import Controller, get, post, put, delete, Request
+from litestar.response import Stream
 from litestar.exceptions import NotFoundException, ValidationException
 from litestar.params import Parameter
 from litestar.datastructures import UploadFile
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc
-from app.database import get_db_session
-from app.models import Report, ReportExecution
+from sqlalchemy import select, update, desc, exists, func, delete as sql_delete
+from sqlalchemy.orm import selectinload, defer
+from app.config import settings
+from app.database import get_db_session, async_session_factory, keyset_before, raiseload_options
+from app.models import Report, ReportExecution, Task
 from app.schemas import (
     ReportCreate, 
     ReportUpdate, 
     ReportResponse, 
     ReportWithExecutions,
+    ReportWithRecentExecutions,
+    ReportExecutionResponse,
+    ReportExecutionSummary,
     ExecutionTriggerRequest
 )
 from app.scheduler import scheduler
 from app.worker import task_worker
-from app.services.notebook_executor import NotebookExecutor
+from app.services.notebook_executor import notebook_executor
 
 logger = logging.getLogger(__name__)
 
+# Validate whole result lists in one call instead of per item
+_REPORT_LIST = TypeAdapter(List[ReportResponse])
+_REPORT_WITH_EXECUTIONS_LIST = TypeAdapter(List[ReportWithRecentExecutions])
+_EXECUTION_LIST = TypeAdapter(List[ReportExecutionResponse])
+_EXECUTION_SUMMARY_LIST = TypeAdapter(List[ReportExecutionSummary])
+
+# Rows fetched per round trip when streaming executions
+STREAM_YIELD_PER = 500
+
+# Seconds a cached report response stays valid; also bounds how long
+# executions added by the worker can be missing from it
+REPORT_CACHE_TTL = 5.0
+REPORT_CACHE_MAX_SIZE = 256
+
+# (report_id, include_executions) -> (ttl_deadline, response)
+_report_cache: Dict[Tuple[int, bool], Tuple[float, Union[ReportResponse, ReportWithExecutions]]] = {}
+
+
+def _invalidate_report_cache(report_id: Optional[int] = None) -> None:
+    """Drop cached responses for a report, or for all reports."""
+    if report_id is None:
+        _report_cache.clear()
+    else:
+        _report_cache.pop((report_id, True), None)
+        _report_cache.pop((report_id, False), None)
+
+
+async def _load_recent_executions(
+    db_session: AsyncSession,
+    report_ids: List[int]
+) -> Dict[int, List[ReportExecution]]:
+    """Get newest executions of the given reports, recent_executions_limit per report."""
+    # Number only the page's rows, by id, through the (report_id, started_at, id) index
+    ranked = (
+        select(
+            ReportExecution.id,
+            func.row_number().over(
+                partition_by=ReportExecution.report_id,
+                order_by=(ReportExecution.started_at.desc(), ReportExecution.id.desc())
+            ).label("row_number")
+        )
+        .where(ReportExecution.report_id.in_(report_ids))
+        .subquery()
+    )
+    
+    # Join back for full rows of the top executions only
+    result = await db_session.execute(
+        select(ReportExecution)
+        .join(ranked, ranked.c.id == ReportExecution.id)
+        .where(ranked.c.row_number <= settings.recent_executions_limit)
+        .order_by(ReportExecution.report_id, ranked.c.row_number)
+        .options(*raiseload_options())
+    )
+    
+    executions_by_report: Dict[int, List[ReportExecution]] = {}
+    for execution in result.scalars():
+        executions_by_report.setdefault(execution.report_id, []).append(execution)
+    return executions_by_report
+
+
+async def _stream_executions(query, include_details: bool = True) -> AsyncIterator[bytes]:
+    """Stream executions as a JSON array, one row at a time."""
+    # Own session: the request session is closed before the body is sent
+    async with async_session_factory() as session:
+        # Server-side cursor, rows fetched in batches rather than all at once
+        result = await session.stream(query.execution_options(yield_per=STREAM_YIELD_PER))
+        yield b"["
+        first = True
+        schema = ReportExecutionResponse if include_details else ReportExecutionSummary
+        async for execution in result.scalars():
+            if not first:
+                yield b","
+            first = False
+            yield schema.model_validate(execution).model_dump_json().encode()
+        yield b"]"
+
 
 class ReportsController(Controller):
     """Controller for report management."""
@@ -39,28 +123,48 @@ class ReportsController(Controller):
         request: Request,
         db_session: AsyncSession,
         limit: int = Parameter(default=50, ge=1, le=100),
-        offset: int = Parameter(default=0, ge=0),
-        include_executions: bool = Parameter(default=False)
-    ) -> List[Union[ReportResponse, ReportWithExecutions]]:
-        """Get list of reports."""
-        query = select(Report).where(~Report.name.startswith("temp_")).order_by(desc(Report.created_at)).offset(offset).limit(limit)
+        offset: int = Parameter(default=0, ge=0),  # Deprecated: use after_created_at/after_id
+        include_executions: bool = Parameter(default=False),
+        after_created_at: Optional[datetime] = Parameter(default=None),
+        after_id: Optional[int] = Parameter(default=None)
+    ) -> List[Union[ReportResponse, ReportWithRecentExecutions]]:
+        """
+        Get list of reports, newest first.
         
-        if include_executions:
-            query = query.options(
-                # Load executions relationship
-                select(Report).options(
-                    select(ReportExecution).where(ReportExecution.report_id == Report.id)
-                    .order_by(desc(ReportExecution.started_at))
-                )
-            )
+        For the next page pass created_at and id of the last report
+        as after_created_at and after_id. With include_executions only
+        the most recent executions of each report are returned.
+        """
+        query = (
+            select(Report)
+            # Escape "_" so only the literal temp_ prefix is excluded
+            .where(~Report.name.startswith("temp_", autoescape=True))
+            .order_by(desc(Report.created_at), desc(Report.id))
+            .limit(limit)
+        )
+        
+        if after_created_at is not None and after_id is not None:
+            query = query.where(keyset_before(Report.created_at, Report.id, after_created_at, after_id))
+        elif offset:
+            query = query.offset(offset)
+        
+        # Any relationship not loaded explicitly must fail loudly, not lazy load
+        query = query.options(*raiseload_options())
         
         result = await db_session.execute(query)
         reports = result.scalars().all()
         
         if include_executions:
-            return [ReportWithExecutions.model_validate(report) for report in reports]
+            # Top executions of this page in one extra query instead of per report
+            executions_by_report = await _load_recent_executions(
+                db_session, [report.id for report in reports]
+            ) if reports else {}
+            for report in reports:
+                # Plain attribute read by ReportWithRecentExecutions, not a relationship
+                report.recent_executions = executions_by_report.get(report.id, [])
+            return _REPORT_WITH_EXECUTIONS_LIST.validate_python(reports, from_attributes=True)
         else:
-            return [ReportResponse.model_validate(report) for report in reports]
+            return _REPORT_LIST.validate_python(reports, from_attributes=True)
     
     @get("/{report_id:int}")
     async def get_report(
@@ -70,13 +174,17 @@ class ReportsController(Controller):
         include_executions: bool = Parameter(default=True)
     ) -> Union[ReportResponse, ReportWithExecutions]:
         """Get a specific report."""
+        cache_key = (report_id, include_executions)
+        cached = _report_cache.get(cache_key)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+        
         query = select(Report).where(Report.id == report_id)
         
         if include_executions:
-            query = query.options(
-                select(ReportExecution).where(ReportExecution.report_id == report_id)
-                .order_by(desc(ReportExecution.started_at))
-            )
+            query = query.options(selectinload(Report.executions))
+        
+        query = query.options(*raiseload_options())
         
         result = await db_session.execute(query)
         report = result.scalar_one_or_none()
@@ -85,9 +193,14 @@ class ReportsController(Controller):
             raise NotFoundException(f"Report with id {report_id} not found")
         
         if include_executions:
-            return ReportWithExecutions.model_validate(report)
+            response = ReportWithExecutions.model_validate(report)
         else:
-            return ReportResponse.model_validate(report)
+            response = ReportResponse.model_validate(report)
+        
+        if len(_report_cache) >= REPORT_CACHE_MAX_SIZE:
+            _report_cache.clear()
+        _report_cache[cache_key] = (time.monotonic() + REPORT_CACHE_TTL, response)
+        return response
     
     @post("/")
     async def create_report(
@@ -99,7 +212,6 @@ class ReportsController(Controller):
         report = Report(**data.model_dump())
         db_session.add(report)
         await db_session.commit()
-        await db_session.refresh(report)
         
         return ReportResponse.model_validate(report)
     
@@ -111,6 +223,19 @@ class ReportsController(Controller):
         db_session: AsyncSession
     ) -> ReportResponse:
         """Update a report."""
+        update_data = data.model_dump(exclude_unset=True)
+        
+        if update_data:
+            # Update in place without loading the row first
+            result = await db_session.execute(
+                update(Report)
+                .where(Report.id == report_id)
+                .values(**update_data)
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount == 0:
+                raise NotFoundException(f"Report with id {report_id} not found")
+        
         result = await db_session.execute(
             select(Report).where(Report.id == report_id)
         )
@@ -119,13 +244,8 @@ class ReportsController(Controller):
         if not report:
             raise NotFoundException(f"Report with id {report_id} not found")
         
-        # Update fields
-        update_data = data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(report, field, value)
-        
         await db_session.commit()
-        await db_session.refresh(report)
+        _invalidate_report_cache(report_id)
         
         return ReportResponse.model_validate(report)
     
@@ -146,6 +266,7 @@ class ReportsController(Controller):
         
         await db_session.delete(report)
         await db_session.commit()
+        _invalidate_report_cache(report_id)
         
         return {"message": "Report deleted successfully"}
     
@@ -173,31 +294,55 @@ class ReportsController(Controller):
         report_id: int,
         db_session: AsyncSession,
         limit: int = Parameter(default=20, ge=1, le=100),
-        offset: int = Parameter(default=0, ge=0)
-    ) -> List[dict]:
-        """Get executions for a specific report."""
-        result = await db_session.execute(
+        offset: int = Parameter(default=0, ge=0),  # Deprecated: use after_started_at/after_id
+        after_started_at: Optional[datetime] = Parameter(default=None),
+        after_id: Optional[int] = Parameter(default=None),
+        stream: bool = Parameter(default=False),
+        include_details: bool = Parameter(default=True)
+    ) -> Union[List[ReportExecutionResponse], List[ReportExecutionSummary], Stream]:
+        """
+        Get executions for a specific report, newest first.
+        
+        For the next page pass started_at and id of the last execution
+        as after_started_at and after_id. With stream=true rows are
+        written to the response as they are fetched. With
+        include_details=false execution_log and artifacts are not loaded.
+        """
+        query = (
             select(ReportExecution)
             .where(ReportExecution.report_id == report_id)
-            .order_by(desc(ReportExecution.started_at))
-            .offset(offset)
+            .order_by(desc(ReportExecution.started_at), desc(ReportExecution.id))
             .limit(limit)
+            .options(*raiseload_options())
         )
+        
+        if after_started_at is not None and after_id is not None:
+            query = query.where(
+                keyset_before(ReportExecution.started_at, ReportExecution.id, after_started_at, after_id)
+            )
+        elif offset:
+            query = query.offset(offset)
+        
+        if not include_details:
+            # Logs and artifacts can be large, leave them in the database
+            query = query.options(
+                defer(ReportExecution.execution_log, raiseload=True),
+                defer(ReportExecution.artifacts, raiseload=True)
+            )
+        
+        if stream:
+            return Stream(
+                _stream_executions(query, include_details),
+                media_type="application/json"
+            )
+        
+        result = await db_session.execute(query)
         executions = result.scalars().all()
         
-        return [
-            {
-                "id": exec.id,
-                "status": exec.status,
-                "started_at": exec.started_at,
-                "completed_at": exec.completed_at,
-                "error_message": exec.error_message,
-                "html_output_path": exec.html_output_path,
-                "artifacts": exec.artifacts,
-                "execution_log": exec.execution_log
-            }
-            for exec in executions
-        ]
+        if include_details:
+            return _EXECUTION_LIST.validate_python(executions, from_attributes=True)
+        else:
+            return _EXECUTION_SUMMARY_LIST.validate_python(executions, from_attributes=True)
     
     @post("/execute-direct")
     async def execute_direct(
@@ -219,18 +364,26 @@ class ReportsController(Controller):
             if not name or not notebook_path:
                 raise ValidationException(detail="Name and notebook_path are required")
             
-            # Check if report already exists
-            result = await db_session.execute(
-                select(Report).where(Report.name == name)
+            # Check if report already exists, only its id is needed
+            existing_report_id = await db_session.scalar(
+                select(Report.id).where(Report.name == name).limit(1)
+            )
+            
+            # Create a high-priority manual task
+            task = Task(
+                schedule_id=None,
+                task_type="manual",
+                priority=2,
+                status="pending"
             )
-            existing_report = result.scalar_one_or_none()
             
-            if existing_report:
+            if existing_report_id is not None:
                 # Use existing report
-                report = existing_report
+                task.report_id = existing_report_id
             else:
-                # Create a new permanent report
-                report = Report(
+                # Create a new permanent report, it and the task
+                # are inserted by a single flush
+                task.report = Report(
                     name=name,
                     description=f"Report for {name}",
                     notebook_path=notebook_path,
@@ -238,17 +391,16 @@ class ReportsController(Controller):
                     variables=variables,
                     artifacts_config=artifacts_config
                 )
-                db_session.add(report)
-                await db_session.commit()
-                await db_session.refresh(report)
             
-            # Create a high-priority manual task
-            task_id = await scheduler.create_manual_task(report.id, priority=2)
+            db_session.add(task)
+            await db_session.commit()
+            
+            logger.info(f"Manual task created for report {name} (task_id: {task.id})")
             
             return {
                 "message": "Report execution task created",
-                "task_id": task_id,
-                "report_id": report.id
+                "task_id": task.id,
+                "report_id": task.report_id
             }
             
         except Exception as e:
@@ -283,10 +435,12 @@ class ReportsController(Controller):
             except json.JSONDecodeError:
                 variables = {}
             
-            # Update report variables if provided
-            if variables:
+            # Update report variables if provided and changed
+            # (dict comparison is deep, so equal JSON compares equal)
+            if variables and variables != report.variables:
                 report.variables = variables
                 await db_session.commit()
+                _invalidate_report_cache(report_id)
             
             # Create task with files information
             task_id = await scheduler.create_manual_task_with_files(
@@ -323,8 +477,7 @@ class ReportsController(Controller):
                 raise NotFoundException(f"Report with id {report_id} not found")
             
             # Scan notebook for variables
-            executor = NotebookExecutor()
-            variables = executor.scan_notebook_variables(report.notebook_path)
+            variables = notebook_executor.scan_notebook_variables(report.notebook_path)
             
             return {
                 "variables": variables,
@@ -346,19 +499,19 @@ class ReportsController(Controller):
         # Delete reports without executions older than 7 days
         cutoff_time = datetime.now() - timedelta(days=7)
         
+        # Single bulk DELETE; NOT EXISTS is resolved through the indexed
+        # report_id and, unlike a self-referencing IN subquery, works on MySQL
         result = await db_session.execute(
-            select(Report)
+            sql_delete(Report)
             .where(Report.created_at < cutoff_time)
-            .where(~Report.executions.any())  # No executions
+            .where(~exists().where(ReportExecution.report_id == Report.id))  # No executions
+            .execution_options(synchronize_session=False)
         )
-        old_reports = result.scalars().all()
-        
-        deleted_count = 0
-        for report in old_reports:
-            await db_session.delete(report)
-            deleted_count += 1
+        deleted_count = result.rowcount
         
         await db_session.commit()
+        if deleted_count:
+            _invalidate_report_cache()
         
         return {
             "message": f"Cleaned up {deleted_count} old reports without executions",
@@ -1,14 +1,16 @@
 """Schedule management API routes."""
+import time
 from datetime import datetime
 from typing import List, Optional, Union
 from litestar import Controller, get, post, put, delete, Request
 from litestar.exceptions import NotFoundException, ValidationException
 from litestar.params import Parameter
+from litestar.response import Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc, and_
 from sqlalchemy.orm import selectinload
-from croniter import croniter
-from app.database import get_db_session
+from app.database import get_db_session, keyset_before, raiseload_options
 from app.models import Schedule, ScheduleExecution, Report, ReportExecution
 from app.schemas import (
     ScheduleCreate, 
@@ -16,10 +18,30 @@ from app.schemas import (
     ScheduleResponse, 
     ScheduleWithExecutions,
     ScheduleExecutionResponse,
-    ScheduleTriggerRequest
+    ScheduleTriggerRequest,
+    CronValidateRequest,
+    CronValidateResponse
 )
 from app.scheduler import scheduler
 from app.worker import task_worker
+from app.services.cron import get_cron, get_cron_error, get_next_run
+from app.services.circuit_breaker import DB_UNAVAILABLE_ERRORS, db_circuit_breaker, stale_response
+
+# Validate whole result lists in one call instead of per item
+_SCHEDULE_LIST = TypeAdapter(List[ScheduleResponse])
+_SCHEDULE_WITH_EXECUTIONS_LIST = TypeAdapter(List[ScheduleWithExecutions])
+_SCHEDULE_EXECUTION_LIST = TypeAdapter(List[ScheduleExecutionResponse])
+
+# Seconds a cached active schedule list stays valid; also bounds how long
+# next_run/last_run updates made by the scheduler can be missing from it
+ACTIVE_SCHEDULES_TTL = 5.0
+
+_active_schedules_cache = {"ttl_deadline": 0.0, "value": None}
+
+
+def _invalidate_active_schedules_cache() -> None:
+    """Drop cached active schedule list."""
+    _active_schedules_cache.update(ttl_deadline=0.0, value=None)
 
 
 class SchedulesController(Controller):
@@ -36,17 +58,31 @@ class SchedulesController(Controller):
         request: Request,
         db_session: AsyncSession,
         limit: int = Parameter(default=50, ge=1, le=100),
-        offset: int = Parameter(default=0, ge=0),
+        offset: int = Parameter(default=0, ge=0),  # Deprecated: use after_created_at/after_id
         include_executions: bool = Parameter(default=False),
-        report_id: Optional[int] = Parameter(default=None)
+        report_id: Optional[int] = Parameter(default=None),
+        after_created_at: Optional[datetime] = Parameter(default=None),
+        after_id: Optional[int] = Parameter(default=None)
     ) -> List[Union[ScheduleResponse, ScheduleWithExecutions]]:
-        """Get list of schedules."""
-        query = select(Schedule).order_by(desc(Schedule.created_at))
+        """
+        Get list of schedules, newest first.
+        
+        For the next page pass created_at and id of the last schedule
+        as after_created_at and after_id.
+        """
+        query = (
+            select(Schedule)
+            .order_by(desc(Schedule.created_at), desc(Schedule.id))
+            .limit(limit)
+        )
         
         if report_id:
             query = query.where(Schedule.report_id == report_id)
         
-        query = query.offset(offset).limit(limit)
+        if after_created_at is not None and after_id is not None:
+            query = query.where(keyset_before(Schedule.created_at, Schedule.id, after_created_at, after_id))
+        elif offset:
+            query = query.offset(offset)
         
         if include_executions:
             query = query.options(
@@ -54,13 +90,16 @@ class SchedulesController(Controller):
                 selectinload(Schedule.report)
             )
         
+        # Any relationship not loaded above must fail loudly, not lazy load
+        query = query.options(*raiseload_options())
+        
         result = await db_session.execute(query)
         schedules = result.scalars().all()
         
         if include_executions:
-            return [ScheduleWithExecutions.model_validate(schedule) for schedule in schedules]
+            return _SCHEDULE_WITH_EXECUTIONS_LIST.validate_python(schedules, from_attributes=True)
         else:
-            return [ScheduleResponse.model_validate(schedule) for schedule in schedules]
+            return _SCHEDULE_LIST.validate_python(schedules, from_attributes=True)
     
     @get("/{schedule_id:int}")
     async def get_schedule(
@@ -78,6 +117,9 @@ class SchedulesController(Controller):
                 selectinload(Schedule.report)
             )
         
+        # Any relationship not loaded above must fail loudly, not lazy load
+        query = query.options(*raiseload_options())
+        
         result = await db_session.execute(query)
         schedule = result.scalar_one_or_none()
         
@@ -98,30 +140,27 @@ class SchedulesController(Controller):
         """Create a new schedule."""
         # Validate that the report exists
         result = await db_session.execute(
-            select(Report).where(Report.id == data.report_id)
+            select(Report.id).where(Report.id == data.report_id)
         )
-        report = result.scalar_one_or_none()
         
-        if not report:
+        if result.scalar_one_or_none() is None:
             raise ValidationException(detail=f"Report with id {data.report_id} not found")
         
-        # Validate cron expression
+        # Validate cron expression and calculate next run time
         try:
-            croniter(data.cron_expression, datetime.now())
+            next_run = get_next_run(data.cron_expression, datetime.now())
         except Exception as e:
             raise ValidationException(detail=f"Invalid cron expression: {str(e)}")
         
-        # Calculate next run time
-        cron = croniter(data.cron_expression, datetime.now())
-        next_run = cron.get_next(datetime)
-        
         schedule = Schedule(
             **data.model_dump(),
             next_run=next_run
         )
         db_session.add(schedule)
         await db_session.commit()
-        await db_session.refresh(schedule)
+        _invalidate_active_schedules_cache()
+        # Let the scheduler recompute its sleep for the new next_run
+        scheduler.wake()
         
         return ScheduleResponse.model_validate(schedule)
     
@@ -149,13 +188,14 @@ class SchedulesController(Controller):
         # Recalculate next run time if cron expression changed
         if 'cron_expression' in update_data:
             try:
-                cron = croniter(schedule.cron_expression, datetime.now())
-                schedule.next_run = cron.get_next(datetime)
+                schedule.next_run = get_next_run(schedule.cron_expression, datetime.now())
             except Exception as e:
                 raise ValidationException(detail=f"Invalid cron expression: {str(e)}")
         
         await db_session.commit()
-        await db_session.refresh(schedule)
+        _invalidate_active_schedules_cache()
+        # Let the scheduler recompute its sleep for the new next_run
+        scheduler.wake()
         
         return ScheduleResponse.model_validate(schedule)
     
@@ -176,6 +216,7 @@ class SchedulesController(Controller):
         
         await db_session.delete(schedule)
         await db_session.commit()
+        _invalidate_active_schedules_cache()
         
         return {"message": "Schedule deleted successfully"}
     
@@ -216,62 +257,97 @@ class SchedulesController(Controller):
         schedule_id: int,
         db_session: AsyncSession,
         limit: int = Parameter(default=20, ge=1, le=100),
-        offset: int = Parameter(default=0, ge=0)
+        offset: int = Parameter(default=0, ge=0),  # Deprecated: use after_scheduled_at/after_id
+        after_scheduled_at: Optional[datetime] = Parameter(default=None),
+        after_id: Optional[int] = Parameter(default=None)
     ) -> List[ScheduleExecutionResponse]:
-        """Get executions for a specific schedule."""
-        result = await db_session.execute(
+        """
+        Get executions for a specific schedule, newest first.
+        
+        For the next page pass scheduled_at and id of the last execution
+        as after_scheduled_at and after_id.
+        """
+        query = (
             select(ScheduleExecution)
             .where(ScheduleExecution.schedule_id == schedule_id)
-            .order_by(desc(ScheduleExecution.scheduled_at))
-            .offset(offset)
+            .order_by(desc(ScheduleExecution.scheduled_at), desc(ScheduleExecution.id))
             .limit(limit)
+            .options(*raiseload_options())
         )
+        
+        if after_scheduled_at is not None and after_id is not None:
+            query = query.where(
+                keyset_before(ScheduleExecution.scheduled_at, ScheduleExecution.id, after_scheduled_at, after_id)
+            )
+        elif offset:
+            query = query.offset(offset)
+        
+        result = await db_session.execute(query)
         executions = result.scalars().all()
         
-        return [ScheduleExecutionResponse.model_validate(exec) for exec in executions]
+        return _SCHEDULE_EXECUTION_LIST.validate_python(executions, from_attributes=True)
     
     @get("/active")
     async def get_active_schedules(
         self,
-        db_session: AsyncSession
-    ) -> List[ScheduleResponse]:
+        db_session: AsyncSession,
+        nocache: bool = Parameter(default=False)
+    ) -> Response[List[ScheduleResponse]]:
         """Get all active schedules."""
-        result = await db_session.execute(
-            select(Schedule)
-            .where(Schedule.is_active == True)
-            .order_by(Schedule.next_run.asc())
-        )
+        if (
+            not nocache
+            and _active_schedules_cache["value"] is not None
+            and time.monotonic() < _active_schedules_cache["ttl_deadline"]
+        ):
+            return Response(_active_schedules_cache["value"])
+        
+        # Database down: serve the last known list instead of failing
+        if not db_circuit_breaker.allow_request():
+            return stale_response(_active_schedules_cache["value"])
+        
+        try:
+            result = await db_session.execute(
+                select(Schedule)
+                .where(Schedule.is_active == True)
+                .order_by(Schedule.next_run.asc())
+                .options(*raiseload_options())
+            )
+        except DB_UNAVAILABLE_ERRORS:
+            db_circuit_breaker.record_failure()
+            return stale_response(_active_schedules_cache["value"])
+        db_circuit_breaker.record_success()
+        
         schedules = result.scalars().all()
         
-        return [ScheduleResponse.model_validate(schedule) for schedule in schedules]
+        response = _SCHEDULE_LIST.validate_python(schedules, from_attributes=True)
+        
+        _active_schedules_cache.update(
+            ttl_deadline=time.monotonic() + ACTIVE_SCHEDULES_TTL,
+            value=response
+        )
+        return Response(response)
     
     @post("/validate-cron")
     async def validate_cron_expression(
         self,
-        data: dict
-    ) -> dict:
+        data: CronValidateRequest
+    ) -> CronValidateResponse:
         """Validate a cron expression."""
-        cron_expression = data.get("cron_expression")
+        # Parse result is cached, repeated checks of the same expression are cheap
+        error = get_cron_error(data.cron_expression)
+        if error is not None:
+            return CronValidateResponse(valid=False, error=error)
         
-        if not cron_expression:
-            raise ValidationException(detail="cron_expression is required")
+        cron = get_cron(data.cron_expression, datetime.now())
+        next_run = cron.get_next(datetime)
+        prev_run = cron.get_prev(datetime)
         
-        try:
-            cron = croniter(cron_expression, datetime.now())
-            next_run = cron.get_next(datetime)
-            prev_run = cron.get_prev(datetime)
-            
-            return {
-                "valid": True,
-                "next_run": next_run.isoformat(),
-                "previous_run": prev_run.isoformat(),
-                "description": f"Next execution: {next_run.strftime('%Y-%m-%d %H:%M:%S')}"
-            }
-        except Exception as e:
-            return {
-                "valid": False,
-                "error": str(e)
-            }
+        return CronValidateResponse(
+            valid=True,
+            next_run=next_run,
+            previous_run=prev_run,
+            description=f"Next execution: {next_run.strftime('%Y-%m-%d %H:%M:%S')}"
+        )
     
     @put("/{schedule_id:int}/toggle")
     async def toggle_schedule(
@@ -292,12 +368,13 @@ class SchedulesController(Controller):
         
         # Recalculate next run time if activating
         if schedule.is_active:
-            cron = croniter(schedule.cron_expression, datetime.now())
-            schedule.next_run = cron.get_next(datetime)
+            schedule.next_run = get_next_run(schedule.cron_expression, datetime.now())
         else:
             schedule.next_run = None
         
         await db_session.commit()
-        await db_session.refresh(schedule)
+        _invalidate_active_schedules_cache()
+        # Let the scheduler recompute its sleep for the new next_run
+        scheduler.wake()
         
         return ScheduleResponse.model_validate(schedule)
@@ -1,19 +1,38 @@
 """Task management API routes."""
+import time
 from datetime import datetime
 from typing import List, Optional, Union
 from litestar import Controller, get, post, delete, Request
 from litestar.exceptions import NotFoundException, ValidationException
 from litestar.params import Parameter
+from litestar.response import Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc, and_
+from sqlalchemy import select, desc, and_, func, delete as sql_delete
 from sqlalchemy.orm import selectinload
-from app.database import get_db_session
+from app.database import engine, get_db_session, keyset_before, raiseload_options
 from app.models import Task, Report, Schedule
 from app.schemas import (
     TaskResponse, 
     TaskWithDetails
 )
 from app.worker import task_worker
+from app.services.circuit_breaker import DB_UNAVAILABLE_ERRORS, db_circuit_breaker, stale_response
+
+# Validate whole result lists in one call instead of per item
+_TASK_LIST = TypeAdapter(List[TaskResponse])
+_TASK_WITH_DETAILS_LIST = TypeAdapter(List[TaskWithDetails])
+
+# Seconds cached queue counts stay valid for polling dashboards
+QUEUE_STATUS_TTL = 2.0
+
+_queue_status_cache = {"ttl_deadline": 0.0, "value": None}
+
+# Last served task pages, kept only as a fallback while the database is down
+TASKS_FALLBACK_MAX_SIZE = 64
+
+# (query parameters) -> response
+_tasks_fallback_cache = {}
 
 
 class TasksController(Controller):
@@ -30,13 +49,26 @@ class TasksController(Controller):
         request: Request,
         db_session: AsyncSession,
         limit: int = Parameter(default=50, ge=1, le=100),
-        offset: int = Parameter(default=0, ge=0),
+        offset: int = Parameter(default=0, ge=0),  # Deprecated: use after_created_at/after_id
         status: Optional[str] = Parameter(default=None),
         task_type: Optional[str] = Parameter(default=None),
-        report_id: Optional[int] = Parameter(default=None)
-    ) -> List[Union[TaskResponse, TaskWithDetails]]:
-        """Get list of tasks."""
-        query = select(Task).order_by(desc(Task.created_at))
+        report_id: Optional[int] = Parameter(default=None),
+        after_created_at: Optional[datetime] = Parameter(default=None),
+        after_id: Optional[int] = Parameter(default=None)
+    ) -> Response[List[Union[TaskResponse, TaskWithDetails]]]:
+        """
+        Get list of tasks, newest first.
+        
+        For the next page pass created_at and id of the last task
+        as after_created_at and after_id.
+        """
+        cache_key = (limit, offset, status, task_type, report_id, after_created_at, after_id)
+        
+        # Database down: serve the last known page instead of failing
+        if not db_circuit_breaker.allow_request():
+            return stale_response(_tasks_fallback_cache.get(cache_key))
+        
+        query = select(Task).order_by(desc(Task.created_at), desc(Task.id))
         
         if status:
             query = query.where(Task.status == status)
@@ -47,18 +79,37 @@ class TasksController(Controller):
         if report_id:
             query = query.where(Task.report_id == report_id)
         
-        query = query.offset(offset).limit(limit)
+        if after_created_at is not None and after_id is not None:
+            query = query.where(keyset_before(Task.created_at, Task.id, after_created_at, after_id))
+        elif offset:
+            query = query.offset(offset)
+        
+        query = query.limit(limit)
         
         # Always include related data
         query = query.options(
             selectinload(Task.report),
-            selectinload(Task.schedule)
+            selectinload(Task.schedule),
+            *raiseload_options()
         )
         
-        result = await db_session.execute(query)
+        try:
+            result = await db_session.execute(query)
+        except DB_UNAVAILABLE_ERRORS:
+            db_circuit_breaker.record_failure()
+            return stale_response(_tasks_fallback_cache.get(cache_key))
+        db_circuit_breaker.record_success()
+        
         tasks = result.scalars().all()
+        response = _TASK_WITH_DETAILS_LIST.validate_python(tasks, from_attributes=True)
+        
+        _tasks_fallback_cache.pop(cache_key, None)
+        _tasks_fallback_cache[cache_key] = response
+        if len(_tasks_fallback_cache) > TASKS_FALLBACK_MAX_SIZE:
+            # Drop the least recently stored page
+            del _tasks_fallback_cache[next(iter(_tasks_fallback_cache))]
         
-        return [TaskWithDetails.model_validate(task) for task in tasks]
+        return Response(response)
     
     @get("/{task_id:int}")
     async def get_task(
@@ -72,7 +123,8 @@ class TasksController(Controller):
             .where(Task.id == task_id)
             .options(
                 selectinload(Task.report),
-                selectinload(Task.schedule)
+                selectinload(Task.schedule),
+                *raiseload_options()
             )
         )
         task = result.scalar_one_or_none()
@@ -85,37 +137,51 @@ class TasksController(Controller):
     @get("/queue/status")
     async def get_queue_status(
         self,
-        db_session: AsyncSession
-    ) -> dict:
+        db_session: AsyncSession,
+        nocache: bool = Parameter(default=False)
+    ) -> Response[dict]:
         """Get current task queue status."""
-        # Get counts by status
-        pending_result = await db_session.execute(
-            select(Task).where(Task.status == "pending")
-        )
-        pending_count = len(pending_result.scalars().all())
+        counts = _queue_status_cache["value"]
+        stale = False
         
-        running_result = await db_session.execute(
-            select(Task).where(Task.status == "running")
-        )
-        running_count = len(running_result.scalars().all())
+        if nocache or counts is None or time.monotonic() >= _queue_status_cache["ttl_deadline"]:
+            # Database down: report the last known counts instead of failing
+            stale = not db_circuit_breaker.allow_request()
+            
+            if not stale:
+                try:
+                    # Count tasks per status in one aggregate query
+                    result = await db_session.execute(
+                        select(Task.status, func.count()).group_by(Task.status)
+                    )
+                except DB_UNAVAILABLE_ERRORS:
+                    db_circuit_breaker.record_failure()
+                    stale = True
+                else:
+                    db_circuit_breaker.record_success()
+                    counts = dict(result.all())
+                    _queue_status_cache.update(
+                        ttl_deadline=time.monotonic() + QUEUE_STATUS_TTL,
+                        value=counts
+                    )
         
-        completed_result = await db_session.execute(
-            select(Task).where(Task.status == "completed")
-        )
-        completed_count = len(completed_result.scalars().all())
+        if stale and counts is None:
+            return stale_response(None)
         
-        failed_result = await db_session.execute(
-            select(Task).where(Task.status == "failed")
-        )
-        failed_count = len(failed_result.scalars().all())
-        
-        return {
-            "pending": pending_count,
-            "running": running_count,
-            "completed": completed_count,
-            "failed": failed_count,
-            "worker_running": task_worker.running
+        status = {
+            "pending": counts.get("pending", 0),
+            "running": counts.get("running", 0),
+            "completed": counts.get("completed", 0),
+            "failed": counts.get("failed", 0),
+            "worker_running": task_worker.running,
+            # Connection pool saturation, read live
+            "db_pool": {
+                "size": engine.pool.size(),
+                "checked_out": engine.pool.checkedout(),
+                "overflow": max(engine.pool.overflow(), 0)
+            }
         }
+        return stale_response(status) if stale else Response(status)
     
     @get("/pending")
     async def get_pending_tasks(
@@ -129,10 +195,11 @@ class TasksController(Controller):
             .where(Task.status == "pending")
             .order_by(Task.priority.desc(), Task.created_at.asc())
             .limit(limit)
+            .options(*raiseload_options())
         )
         tasks = result.scalars().all()
         
-        return [TaskResponse.model_validate(task) for task in tasks]
+        return _TASK_LIST.validate_python(tasks, from_attributes=True)
     
     @get("/running")
     async def get_running_tasks(
@@ -146,12 +213,13 @@ class TasksController(Controller):
             .order_by(Task.started_at.asc())
             .options(
                 selectinload(Task.report),
-                selectinload(Task.schedule)
+                selectinload(Task.schedule),
+                *raiseload_options()
             )
         )
         tasks = result.scalars().all()
         
-        return [TaskWithDetails.model_validate(task) for task in tasks]
+        return _TASK_WITH_DETAILS_LIST.validate_python(tasks, from_attributes=True)
     
     @delete("/{task_id:int}", status_code=200)
     async def cancel_task(
@@ -190,21 +258,18 @@ class TasksController(Controller):
         
         cutoff_time = datetime.now() - timedelta(hours=older_than_hours)
         
+        # Single bulk DELETE instead of loading and deleting tasks one by one
         result = await db_session.execute(
-            select(Task)
+            sql_delete(Task)
             .where(
                 and_(
                     Task.status.in_(["completed", "failed"]),
                     Task.completed_at < cutoff_time
                 )
             )
+            .execution_options(synchronize_session=False)
         )
-        old_tasks = result.scalars().all()
-        
-        deleted_count = 0
-        for task in old_tasks:
-            await db_session.delete(task)
-            deleted_count += 1
+        deleted_count = result.rowcount
         
         await db_session.commit()
         
@@ -1,14 +1,238 @@
 """Web interface routes."""
+import asyncio
+import logging
+import os
+import time
+import zlib
 from datetime import datetime
-from typing import List
-from litestar import Controller, get, Request
-from litestar.response import Template, Response, File
+from email.utils import formatdate
+from functools import lru_cache
+from pathlib import Path
+from typing import AsyncIterator, Dict, Optional, Tuple
+from urllib.parse import quote
+import aiofiles
+import aiofiles.os
+from litestar import Controller, asgi, get, Request
+from litestar.exceptions import NotFoundException
+from litestar.response import Template, Response, File, Stream
+from litestar.types import Receive, Scope, Send
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc
+from sqlalchemy import select, desc, func
 from sqlalchemy.orm import selectinload
-from app.database import get_db_session
+from app.database import get_db_session, raiseload_options
 from app.models import Report, ReportExecution, Schedule, ScheduleExecution, Task
-from app.services.notebook_executor import NotebookExecutor
+from app.services.notebook_executor import notebook_executor
+from app.services.html_cache import html_cache
+
+logger = logging.getLogger(__name__)
+
+# Read size for file downloads
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Rows shown on task list and schedule history pages; totals are counted in SQL
+WEB_LIST_LIMIT = 200
+
+# Execution output paths stored relative to jupyter_output_path start with this
+EXECUTIONS_PREFIX = "executions/"
+
+# Prebuilt empty 204 response messages for browser probe paths
+_NO_CONTENT_START = {"type": "http.response.start", "status": 204, "headers": []}
+_NO_CONTENT_BODY = {"type": "http.response.body", "body": b""}
+
+
+def _execution_html_path(html_output_path: str) -> Path:
+    """Resolve execution HTML output path."""
+    # Relative path (new format) or legacy absolute path
+    if html_output_path.startswith(EXECUTIONS_PREFIX):
+        return notebook_executor.output_path / html_output_path
+    return Path(html_output_path)
+
+
+def _file_validators(stat: os.stat_result) -> Dict[str, str]:
+    """Get conditional request headers for an output file."""
+    return {
+        "etag": f'"{stat.st_mtime_ns}-{stat.st_size}"',
+        "last-modified": formatdate(stat.st_mtime, usegmt=True),
+        # Let browsers keep the page but revalidate, a new run must show up at once
+        "cache-control": "no-cache",
+    }
+
+
+def _page_source_mtime() -> float:
+    """Get newest mtime of the code and templates that render the report page."""
+    sources = [__file__, "templates/report_result.html", "templates/base.html"]
+    return max(os.stat(source).st_mtime for source in sources if os.path.exists(source))
+
+
+# A deploy that changes the page itself must invalidate browser copies too
+_PAGE_SOURCE_MTIME = _page_source_mtime()
+_PAGE_VERSION = f"{int(_PAGE_SOURCE_MTIME):x}"
+
+
+def _page_validators(stat: os.stat_result, files: Tuple[Tuple[str, int, float], ...]) -> Dict[str, str]:
+    """Get conditional request headers for an HTML output shown with its file listing."""
+    headers = _file_validators(stat)
+    # New or rewritten artifacts must change the ETag too, not just the HTML
+    listing = zlib.crc32(repr(files).encode())
+    headers["etag"] = f'"{stat.st_mtime_ns}-{stat.st_size}-{listing:x}-{_PAGE_VERSION}"'
+    newest = max([stat.st_mtime, _PAGE_SOURCE_MTIME] + [mtime for _, _, mtime in files])
+    headers["last-modified"] = formatdate(newest, usegmt=True)
+    return headers
+
+
+def _is_not_modified(request: Request, headers: Dict[str, str]) -> bool:
+    """Check whether client copy matches the ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    etags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in etags or headers["etag"] in etags
+
+
+def _if_range_matches(request: Request, headers: Dict[str, str]) -> bool:
+    """Check If-Range; a mismatch means the file changed and Range must be ignored."""
+    if_range = request.headers.get("if-range")
+    if not if_range:
+        return True
+    if_range = if_range.strip()
+    # Entity tags need a strong match, anything else is an HTTP date
+    if if_range.startswith(('"', "W/")):
+        return if_range == headers["etag"]
+    return if_range == headers["last-modified"]
+
+
+def _parse_range(range_header: str, size: int) -> Optional[Tuple[int, int]]:
+    """Parse single "bytes=" range into inclusive (start, end), None to serve whole file."""
+    unit, _, spec = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    
+    first, _, last = spec.strip().partition("-")
+    try:
+        if first:
+            start = int(first)
+            end = int(last) if last else size - 1
+        else:
+            # Suffix range: last N bytes
+            start = max(size - int(last), 0)
+            end = size - 1
+    except ValueError:
+        return None
+    
+    return start, min(end, size - 1)
+
+
+async def _iter_file_range(file_path: Path, start: int, length: int) -> AsyncIterator[bytes]:
+    """Read part of a file in chunks."""
+    async with aiofiles.open(file_path, 'rb') as f:
+        await f.seek(start)
+        while length > 0:
+            chunk = await f.read(min(DOWNLOAD_CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+@lru_cache(maxsize=256)
+def _real_root(directory: Path) -> str:
+    """Resolve a base directory once; output roots don't move at runtime."""
+    return os.path.realpath(directory) + os.sep
+
+
+def _is_within(file_path: Path, directory: Path) -> bool:
+    """Check that file_path resolves inside directory with a single realpath."""
+    return os.path.realpath(file_path).startswith(_real_root(directory))
+
+
+async def _download_response(request: Request, file_path: Path, filename: str) -> Response:
+    """Serve file as attachment, resuming from a single byte Range if requested."""
+    stat = await aiofiles.os.stat(file_path)
+    headers = _file_validators(stat)
+    if _is_not_modified(request, headers):
+        return Response(content=b"", status_code=304, headers=headers)
+    headers["accept-ranges"] = "bytes"
+    
+    range_header = request.headers.get("range")
+    byte_range = None
+    # Resuming against a changed file would splice bytes of two versions
+    if range_header and _if_range_matches(request, headers):
+        byte_range = _parse_range(range_header, stat.st_size)
+    
+    if byte_range is None:
+        # Reuse our stat so File does not stat the path again
+        return File(
+            path=str(file_path),
+            filename=filename,
+            media_type="application/octet-stream",
+            stat_result=stat,
+            chunk_size=DOWNLOAD_CHUNK_SIZE,
+            headers=headers
+        )
+    
+    start, end = byte_range
+    if start > end:
+        headers["content-range"] = f"bytes */{stat.st_size}"
+        return Response(content=b"", status_code=416, headers=headers)
+    
+    length = end - start + 1
+    headers.update({
+        "content-range": f"bytes {start}-{end}/{stat.st_size}",
+        "content-length": str(length),
+        "content-disposition": f"attachment; filename*=utf-8''{quote(filename)}",
+    })
+    return Stream(
+        _iter_file_range(file_path, start, length),
+        status_code=206,
+        media_type="application/octet-stream",
+        headers=headers
+    )
+
+
+# Directories changed more recently than this are scanned uncached: with coarse
+# timestamps (1 s on ext3/NFS, 2 s on FAT) a later change may keep the same mtime
+SCAN_CACHE_MIN_AGE = 2.0
+
+
+@lru_cache(maxsize=256)
+def _scan_dir(directory: str, mtime_ns: int) -> Tuple[Optional[str], Tuple[str, ...]]:
+    """Scan directory into latest subdirectory name and file names."""
+    latest_subdir = None
+    names = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                # Execution directories are named by timestamp, only the latest is used
+                if latest_subdir is None or entry.name > latest_subdir:
+                    latest_subdir = entry.name
+            elif entry.is_file():
+                names.append(entry.name)
+    return latest_subdir, tuple(names)
+
+
+def _list_dir(directory: Path) -> Tuple[Optional[str], Tuple[Tuple[str, int, float], ...]]:
+    """List directory into latest subdirectory name and (name, size, mtime) files."""
+    # Names are rescanned only when the directory mtime changes (entries added
+    # or removed); files can be rewritten in place, so they are stat()ed fresh
+    dir_stat = os.stat(directory)
+    if time.time() - dir_stat.st_mtime < SCAN_CACHE_MIN_AGE:
+        latest_subdir, names = _scan_dir.__wrapped__(str(directory), dir_stat.st_mtime_ns)
+    else:
+        latest_subdir, names = _scan_dir(str(directory), dir_stat.st_mtime_ns)
+    files = []
+    for name in names:
+        try:
+            stat = os.stat(os.path.join(directory, name))
+        except FileNotFoundError:
+            continue
+        files.append((name, stat.st_size, stat.st_mtime))
+    return latest_subdir, tuple(files)
+
+
+def _latest_html(files: Tuple[Tuple[str, int, float], ...]) -> Optional[str]:
+    """Get name of the most recently modified HTML file."""
+    html_files = [(mtime, name) for name, _, mtime in files if name.endswith(".html")]
+    return max(html_files)[1] if html_files else None
 
 
 class WebController(Controller):
@@ -18,7 +242,6 @@ class WebController(Controller):
     
     def __init__(self, owner=None):
         super().__init__(owner)
-        self.notebook_executor = NotebookExecutor()
     
     @get("/")
     async def index(
@@ -29,19 +252,22 @@ class WebController(Controller):
         """Main page with list of reports."""
         # Get all reports sorted by last execution date (most recent first)
         # Reports without executions will be sorted by creation date
-        from sqlalchemy import func, case
+        # Aggregate executions per report instead of loading them all
+        last_run = func.max(ReportExecution.completed_at).label("last_run")
+        execution_count = func.count(ReportExecution.id).label("execution_count")
         
         result = await db_session.execute(
-            select(Report)
+            select(Report, last_run, execution_count)
             .outerjoin(ReportExecution)
-            .options(selectinload(Report.executions))
+            .options(*raiseload_options())
             .group_by(Report.id)
             .order_by(
-                desc(func.max(ReportExecution.completed_at)),
+                desc(last_run),
                 desc(Report.created_at)
             )
         )
-        reports = result.scalars().all()
+        # (report, last_run, execution_count) rows
+        reports = result.all()
         
         return Template(
             template_name="index.html",
@@ -63,7 +289,17 @@ class WebController(Controller):
         result = await db_session.execute(
             select(Report)
             .where(Report.id == report_id)
-            .options(selectinload(Report.executions))
+            .options(
+                # The table shows only status and timing; logs and artifacts stay in the database
+                selectinload(Report.executions).load_only(
+                    ReportExecution.status,
+                    ReportExecution.started_at,
+                    ReportExecution.completed_at,
+                    ReportExecution.error_message,
+                    raiseload=True
+                ),
+                *raiseload_options()
+            )
         )
         report = result.scalar_one_or_none()
         
@@ -90,12 +326,12 @@ class WebController(Controller):
         execution_id: int,
         request: Request,
         db_session: AsyncSession
-    ) -> Template:
+    ) -> Response:
         """View specific execution result."""
         result = await db_session.execute(
             select(ReportExecution)
             .where(ReportExecution.id == execution_id)
-            .options(selectinload(ReportExecution.report))
+            .options(selectinload(ReportExecution.report), *raiseload_options())
         )
         execution = result.scalar_one_or_none()
         
@@ -108,22 +344,16 @@ class WebController(Controller):
                 }
             )
         
-        # Read HTML content if available
+        # HTML output is embedded from execution_html, only check it exists here
+        html_url = None
         html_content = None
         if execution.html_output_path:
+            html_file_path = _execution_html_path(execution.html_output_path)
             try:
-                # Check if it's a relative path (new format)
-                if execution.html_output_path.startswith("executions/"):
-                    html_file_path = self.notebook_executor.output_path / execution.html_output_path
-                else:
-                    # Legacy absolute path
-                    html_file_path = Path(execution.html_output_path)
-                
-                if html_file_path.exists():
-                    with open(html_file_path, 'r', encoding='utf-8') as f:
-                        html_content = f.read()
-                else:
-                    html_content = f"HTML file not found: {html_file_path}"
+                await html_cache.stat(html_file_path)
+                html_url = f"/execution/{execution.id}/html"
+            except FileNotFoundError:
+                html_content = f"HTML file not found: {html_file_path}"
             except Exception as e:
                 html_content = f"Error reading HTML file: {str(e)}"
         
@@ -131,11 +361,49 @@ class WebController(Controller):
             template_name="execution.html",
             context={
                 "execution": execution,
+                "html_url": html_url,
                 "html_content": html_content,
                 "request": request
             }
         )
     
+    @get("/execution/{execution_id:int}/html")
+    async def execution_html(
+        self,
+        execution_id: int,
+        request: Request,
+        db_session: AsyncSession
+    ) -> Response:
+        """Serve execution HTML output, streamed from disk."""
+        result = await db_session.execute(
+            select(ReportExecution.html_output_path)
+            .where(ReportExecution.id == execution_id)
+        )
+        html_output_path = result.scalar_one_or_none()
+        
+        if not html_output_path:
+            raise NotFoundException(f"No HTML output for execution {execution_id}")
+        
+        html_file_path = _execution_html_path(html_output_path)
+        try:
+            stat = await html_cache.stat(html_file_path)
+        except FileNotFoundError:
+            raise NotFoundException(f"HTML file not found for execution {execution_id}")
+        
+        validators = _file_validators(stat)
+        if _is_not_modified(request, validators):
+            return Response(content=b"", status_code=304, headers=validators)
+        
+        return File(
+            path=str(html_file_path),
+            filename=html_file_path.name,
+            media_type="text/html",
+            content_disposition_type="inline",
+            stat_result=stat,
+            chunk_size=DOWNLOAD_CHUNK_SIZE,
+            headers=validators
+        )
+    
     @get("/notebooks")
     async def notebooks_list(
         self,
@@ -143,7 +411,7 @@ class WebController(Controller):
     ) -> Template:
         """List all available notebooks."""
         # Get list of available notebooks
-        reports = await self.notebook_executor.get_reports_list()
+        reports = await notebook_executor.get_reports_list()
         
         return Template(
             template_name="notebooks.html",
@@ -158,49 +426,63 @@ class WebController(Controller):
         self,
         report_name: str,
         request: Request
-    ) -> Template:
+    ) -> Response:
         """View the latest execution result of a report."""
-        from pathlib import Path
-        
         # First try to find in executions directory (new structure)
-        executions_dir = self.notebook_executor.executions_output_path / report_name
+        executions_dir = notebook_executor.executions_output_path / report_name
         report_output_dir = None
         html_content = None
         all_files = []
+        headers = {}
         
-        if executions_dir.exists():
-            # Find the most recent execution directory
-            execution_dirs = [d for d in executions_dir.iterdir() if d.is_dir()]
-            if execution_dirs:
-                # Sort by date (most recent first)
-                execution_dirs.sort(key=lambda x: x.name, reverse=True)
-                latest_execution_dir = execution_dirs[0]
-                
-                # Find HTML files in the latest execution
-                html_files = list(latest_execution_dir.glob("*.html"))
-                if html_files:
-                    latest_html = max(html_files, key=lambda f: f.stat().st_mtime)
-                    try:
-                        with open(latest_html, 'r', encoding='utf-8') as f:
-                            html_content = f.read()
-                    except Exception as e:
-                        html_content = f"Error reading HTML file: {str(e)}"
-                
-                # Get all files in the execution directory
-                for file_path in latest_execution_dir.iterdir():
-                    if file_path.is_file():
-                        all_files.append({
-                            "name": file_path.name,
-                            "path": f"executions/{report_name}/{latest_execution_dir.name}/{file_path.name}",
-                            "size": file_path.stat().st_size,
-                            "modified": datetime.fromtimestamp(file_path.stat().st_mtime)
-                        })
+        if await aiofiles.os.path.isdir(executions_dir):
+            latest_execution_dir = None
+            
+            # Latest HTML output recorded by the executor
+            latest_html = await notebook_executor.get_latest_html_path(report_name)
+            if latest_html is not None:
+                latest_execution_dir = latest_html.parent
+            else:
+                # No pointer (e.g. older executions): find the most recent execution directory
+                latest_name, _ = await asyncio.to_thread(_list_dir, executions_dir)
+                if latest_name is not None:
+                    latest_execution_dir = executions_dir / latest_name
+            
+            files = ()
+            if latest_execution_dir is not None:
+                # Get all files in the execution directory (off the event loop)
+                _, files = await asyncio.to_thread(_list_dir, latest_execution_dir)
+                if latest_html is None:
+                    # Find HTML files in the latest execution
+                    html_name = _latest_html(files)
+                    if html_name is not None:
+                        latest_html = latest_execution_dir / html_name
+            
+            if latest_html is not None:
+                try:
+                    stat = await html_cache.stat(latest_html)
+                    validators = _page_validators(stat, files)
+                    if _is_not_modified(request, validators):
+                        return Response(content=b"", status_code=304, headers=validators)
+                    
+                    html_content = await html_cache.get(latest_html, stat)
+                    headers = validators
+                except Exception as e:
+                    html_content = f"Error reading HTML file: {str(e)}"
+            
+            for name, size, mtime in files:
+                all_files.append({
+                    "name": name,
+                    "path": f"{EXECUTIONS_PREFIX}{report_name}/{latest_execution_dir.name}/{name}",
+                    "size": size,
+                    "modified": datetime.fromtimestamp(mtime)
+                })
         
         # Fallback to legacy report output directory
         if not html_content:
-            report_output_dir = self.notebook_executor.reports_output_path / report_name
+            report_output_dir = notebook_executor.reports_output_path / report_name
             
-            if not report_output_dir.exists():
+            if not await aiofiles.os.path.isdir(report_output_dir):
                 return Template(
                     template_name="error.html",
                     context={
@@ -210,8 +492,9 @@ class WebController(Controller):
                 )
             
             # Find the latest HTML file
-            html_files = list(report_output_dir.glob("*.html"))
-            if not html_files:
+            _, files = await asyncio.to_thread(_list_dir, report_output_dir)
+            html_name = _latest_html(files)
+            if html_name is None:
                 return Template(
                     template_name="error.html",
                     context={
@@ -220,25 +503,28 @@ class WebController(Controller):
                     }
                 )
             
-            # Get the most recent HTML file
-            latest_html = max(html_files, key=lambda f: f.stat().st_mtime)
+            latest_html = report_output_dir / html_name
             
             # Read HTML content
             try:
-                with open(latest_html, 'r', encoding='utf-8') as f:
-                    html_content = f.read()
+                stat = await html_cache.stat(latest_html)
+                validators = _page_validators(stat, files)
+                if _is_not_modified(request, validators):
+                    return Response(content=b"", status_code=304, headers=validators)
+                
+                html_content = await html_cache.get(latest_html, stat)
+                headers = validators
             except Exception as e:
                 html_content = f"Error reading HTML file: {str(e)}"
             
             # Get all files in the report directory
-            for file_path in report_output_dir.iterdir():
-                if file_path.is_file():
-                    all_files.append({
-                        "name": file_path.name,
-                        "path": str(file_path),
-                        "size": file_path.stat().st_size,
-                        "modified": datetime.fromtimestamp(file_path.stat().st_mtime)
-                    })
+            for name, size, mtime in files:
+                all_files.append({
+                    "name": name,
+                    "path": str(report_output_dir / name),
+                    "size": size,
+                    "modified": datetime.fromtimestamp(mtime)
+                })
         
         return Template(
             template_name="report_result.html",
@@ -247,110 +533,89 @@ class WebController(Controller):
                 "html_content": html_content,
                 "files": all_files,
                 "request": request
-            }
+            },
+            headers=headers
         )
     
     @get("/download/{report_name:str}/{filename:str}")
     async def download_file(
         self,
         report_name: str,
-        filename: str
-    ) -> File:
+        filename: str,
+        request: Request
+    ) -> Response:
         """Download a file from a report output directory."""
-        from pathlib import Path
-        
         # First try to find in executions directory (new structure)
-        executions_dir = self.notebook_executor.executions_output_path / report_name
-        if executions_dir.exists():
+        executions_dir = notebook_executor.executions_output_path / report_name
+        if await aiofiles.os.path.isdir(executions_dir):
             # Find the most recent execution directory
-            execution_dirs = [d for d in executions_dir.iterdir() if d.is_dir()]
-            if execution_dirs:
-                # Sort by date (most recent first)
-                execution_dirs.sort(key=lambda x: x.name, reverse=True)
-                latest_execution_dir = execution_dirs[0]
+            latest_name, _ = await asyncio.to_thread(_list_dir, executions_dir)
+            if latest_name is not None:
+                latest_execution_dir = executions_dir / latest_name
                 file_path = latest_execution_dir / filename
                 
-                if file_path.exists() and file_path.is_file():
-                    # Security check: ensure the file is within the execution directory
-                    try:
-                        file_path.resolve().relative_to(latest_execution_dir.resolve())
-                        return File(
-                            path=str(file_path),
-                            filename=filename,
-                            media_type="application/octet-stream"
-                        )
-                    except ValueError:
-                        pass  # Continue to legacy check
+                if await aiofiles.os.path.isfile(file_path):
+                    # Security check: ensure the file is within the execution directory,
+                    # otherwise continue to legacy check
+                    if _is_within(file_path, latest_execution_dir):
+                        return await _download_response(request, file_path, filename)
         
         # Fallback to legacy report output directory
-        report_output_dir = self.notebook_executor.reports_output_path / report_name
+        report_output_dir = notebook_executor.reports_output_path / report_name
         
-        if not report_output_dir.exists():
+        if not await aiofiles.os.path.isdir(report_output_dir):
             raise FileNotFoundError(f"Report '{report_name}' not found")
         
         # Construct file path
         file_path = report_output_dir / filename
         
-        if not file_path.exists() or not file_path.is_file():
+        if not await aiofiles.os.path.isfile(file_path):
             raise FileNotFoundError(f"File '{filename}' not found in report '{report_name}'")
         
         # Security check: ensure the file is within the report directory
-        try:
-            file_path.resolve().relative_to(report_output_dir.resolve())
-        except ValueError:
+        if not _is_within(file_path, report_output_dir):
             raise FileNotFoundError("Invalid file path")
         
-        return File(
-            path=str(file_path),
-            filename=filename,
-            media_type="application/octet-stream"
-        )
+        return await _download_response(request, file_path, filename)
     
     @get("/proxy-file/{report_name:str}/{execution_date:str}/{filename:str}")
     async def proxy_file(
         self,
         report_name: str,
         execution_date: str,
-        filename: str
-    ) -> File:
+        filename: str,
+        request: Request
+    ) -> Response:
         """Proxy download for files from execution directory."""
-        from pathlib import Path
-        import logging
-        logger = logging.getLogger(__name__)
-        
         logger.info(f"Proxy file request: report_name='{report_name}', execution_date='{execution_date}', filename='{filename}'")
         
         # Construct file path
-        file_path = self.notebook_executor.executions_output_path / report_name / execution_date / filename
+        file_path = notebook_executor.executions_output_path / report_name / execution_date / filename
         logger.info(f"Constructed file path: {file_path}")
-        logger.info(f"File exists: {file_path.exists()}")
-        logger.info(f"Is file: {file_path.is_file()}")
+        is_file = await aiofiles.os.path.isfile(file_path)
+        logger.info(f"Is file: {is_file}")
         
-        if not file_path.exists() or not file_path.is_file():
+        if not is_file:
             logger.warning(f"File not found: {file_path}")
             raise FileNotFoundError(f"File '{filename}' not found in execution '{execution_date}' for report '{report_name}'")
         
         # Security check: ensure the file is within the executions directory
-        try:
-            file_path.resolve().relative_to(self.notebook_executor.executions_output_path.resolve())
-        except ValueError:
+        if not _is_within(file_path, notebook_executor.executions_output_path):
             raise FileNotFoundError("Invalid file path")
         
-        return File(
-            path=str(file_path),
-            filename=filename,
-            media_type="application/octet-stream"
-        )
+        return await _download_response(request, file_path, filename)
     
-    @get("/favicon.ico")
-    async def favicon(self) -> Response:
-        """Handle favicon requests."""
-        return Response(content=b"", status_code=204)
+    @asgi("/favicon.ico")
+    async def favicon(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle favicon requests with a raw empty 204."""
+        await send(_NO_CONTENT_START)
+        await send(_NO_CONTENT_BODY)
     
-    @get("/.well-known/appspecific/com.chrome.devtools.json")
-    async def chrome_devtools(self) -> Response:
+    @asgi("/.well-known/appspecific/com.chrome.devtools.json")
+    async def chrome_devtools(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Handle Chrome DevTools requests to prevent 404 errors in logs."""
-        return Response(content=b"", status_code=204)
+        await send(_NO_CONTENT_START)
+        await send(_NO_CONTENT_BODY)
     
     @get("/schedules")
     async def schedules_list(
@@ -362,7 +627,7 @@ class WebController(Controller):
         # Get all schedules with their reports
         result = await db_session.execute(
             select(Schedule)
-            .options(selectinload(Schedule.report))
+            .options(selectinload(Schedule.report), *raiseload_options())
             .order_by(desc(Schedule.created_at))
         )
         schedules = result.scalars().all()
@@ -383,14 +648,11 @@ class WebController(Controller):
         db_session: AsyncSession
     ) -> Template:
         """View specific schedule with its executions."""
-        # Get schedule with executions and report
+        # Get schedule with its report
         result = await db_session.execute(
             select(Schedule)
             .where(Schedule.id == schedule_id)
-            .options(
-                selectinload(Schedule.executions),
-                selectinload(Schedule.report)
-            )
+            .options(selectinload(Schedule.report), *raiseload_options())
         )
         schedule = result.scalar_one_or_none()
         
@@ -403,10 +665,31 @@ class WebController(Controller):
                 }
             )
         
+        # Latest executions for the history table
+        result = await db_session.execute(
+            select(ScheduleExecution)
+            .where(ScheduleExecution.schedule_id == schedule_id)
+            .order_by(desc(ScheduleExecution.scheduled_at), desc(ScheduleExecution.id))
+            .limit(WEB_LIST_LIMIT)
+            .options(*raiseload_options())
+        )
+        executions = result.scalars().all()
+        
+        # Execution counts per status in one aggregate query
+        result = await db_session.execute(
+            select(ScheduleExecution.status, func.count())
+            .where(ScheduleExecution.schedule_id == schedule_id)
+            .group_by(ScheduleExecution.status)
+        )
+        execution_counts = dict(result.all())
+        
         return Template(
             template_name="schedule.html",
             context={
                 "schedule": schedule,
+                "executions": executions,
+                "execution_counts": execution_counts,
+                "execution_total": sum(execution_counts.values()),
                 "request": request
             }
         )
@@ -418,21 +701,31 @@ class WebController(Controller):
         db_session: AsyncSession
     ) -> Template:
         """List all tasks."""
-        # Get all tasks with their reports and schedules
+        # Get latest tasks with their reports and schedules
         result = await db_session.execute(
             select(Task)
             .options(
                 selectinload(Task.report),
-                selectinload(Task.schedule)
+                selectinload(Task.schedule),
+                *raiseload_options()
             )
-            .order_by(desc(Task.created_at))
+            .order_by(desc(Task.created_at), desc(Task.id))
+            .limit(WEB_LIST_LIMIT)
         )
         tasks = result.scalars().all()
         
+        # Task counts per status in one aggregate query
+        result = await db_session.execute(
+            select(Task.status, func.count()).group_by(Task.status)
+        )
+        task_counts = dict(result.all())
+        
         return Template(
             template_name="tasks.html",
             context={
                 "tasks": tasks,
+                "task_counts": task_counts,
+                "task_total": sum(task_counts.values()),
                 "request": request
             }
         )
@@ -450,7 +743,8 @@ class WebController(Controller):
             .where(Task.id == task_id)
             .options(
                 selectinload(Task.report),
-                selectinload(Task.schedule)
+                selectinload(Task.schedule),
+                *raiseload_options()
             )
         )
         task = result.scalar_one_or_none()
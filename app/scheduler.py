@@ -3,16 +3,26 @@ import asyncio
 import logging
 import threading
 from datetime import datetime
-from typing import List
-from croniter import croniter
+from typing import List, Optional, Tuple
+import aiofiles
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
-from sqlalchemy.orm import selectinload
-from app.database import async_session_factory
+from sqlalchemy import select, insert, update, and_, func
+from app.database import async_session_factory, database_ready
 from app.models import Report, ReportExecution, Schedule, ScheduleExecution, Task
+from app.services.cron import get_cron_error, get_next_runs
 
 logger = logging.getLogger(__name__)
 
+# Uploaded files are copied to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Most due schedules handled per tick; the rest stay due for the next one
+SCHEDULER_BATCH_SIZE = 256
+
+# Bounds for sleeping until the next due schedule (seconds)
+SCHEDULER_MIN_SLEEP = 1.0
+SCHEDULER_MAX_SLEEP = 60.0
+
 
 class Scheduler:
     """Scheduler for creating tasks based on cron expressions."""
@@ -20,6 +30,11 @@ class Scheduler:
     def __init__(self):
         self.running = False
         self._task = None
+        self._wakeup = asyncio.Event()
+    
+    def wake(self):
+        """Wake the scheduler loop to pick up new or changed schedules."""
+        self._wakeup.set()
     
     async def start(self):
         """Start the scheduler."""
@@ -43,79 +58,99 @@ class Scheduler:
     
     async def _scheduler_loop(self):
         """Main scheduler loop."""
+        await database_ready.wait()
         while self.running:
             try:
-                await self._check_and_run_reports()
-                await asyncio.sleep(60)  # Check every minute
+                next_due = await self._check_and_run_reports()
+                await self._sleep_until(next_due)
             except Exception as e:
                 logger.error(f"Error in scheduler loop: {e}")
-                await asyncio.sleep(60)
+                await asyncio.sleep(SCHEDULER_MAX_SLEEP)
     
-    async def _check_and_run_reports(self):
-        """Check which schedules should be run and execute them."""
+    async def _sleep_until(self, next_due: Optional[datetime]):
+        """Sleep until the next due schedule, waking early on wake()."""
+        delay = SCHEDULER_MAX_SLEEP
+        if next_due is not None:
+            delay = (next_due - datetime.now()).total_seconds()
+            # Keep a heartbeat so schedules changed elsewhere are picked up
+            delay = max(SCHEDULER_MIN_SLEEP, min(SCHEDULER_MAX_SLEEP, delay))
+        
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+    
+    async def _check_and_run_reports(self) -> Optional[datetime]:
+        """Create tasks for due schedules and return the next due time."""
         async with async_session_factory() as session:
-            # Get all active schedules that are due to run
+            # One timestamp per tick: due check, last_run and next_run all use it
             now = datetime.now()
             result = await session.execute(
-                select(Schedule)
+                select(Schedule.id, Schedule.name, Schedule.report_id, Schedule.cron_expression)
                 .where(
                     and_(
                         Schedule.is_active == True,
                         Schedule.next_run <= now
                     )
                 )
-                .options(selectinload(Schedule.report))
+                # Range scan on (is_active, next_run), oldest due first
+                .order_by(Schedule.next_run)
+                .limit(SCHEDULER_BATCH_SIZE)
             )
-            schedules = result.scalars().all()
+            # Every row is due: the query already filters next_run <= now
+            schedules = result.all()
             
+            # Invalid cron expressions are skipped here so they can't fail the batch
+            due = []
+            failed_ids = []
             for schedule in schedules:
-                try:
-                    if self._should_run_schedule(schedule):
-                        await self._run_schedule(schedule, session)
-                except Exception as e:
-                    logger.error(f"Error checking schedule {schedule.name}: {e}")
-    
-    def _should_run_schedule(self, schedule: Schedule) -> bool:
-        """Check if schedule should be run based on next_run time."""
-        try:
-            # Check if the schedule is due to run (within the last minute)
-            if schedule.next_run is None:
-                return False
-            
-            time_diff = datetime.now() - schedule.next_run
-            return time_diff.total_seconds() >= 0 and time_diff.total_seconds() < 60
-            
-        except Exception as e:
-            logger.error(f"Error checking schedule {schedule.name}: {e}")
-            return False
-    
-    async def _run_schedule(self, schedule: Schedule, session: AsyncSession):
-        """Create a task for a specific schedule."""
-        logger.info(f"Creating task for schedule: {schedule.name}")
-        
-        try:
-            # Create a task for this schedule
-            task = Task(
-                report_id=schedule.report_id,
-                schedule_id=schedule.id,
-                task_type="scheduled",
-                priority=0,  # Normal priority for scheduled tasks
-                status="pending"
-            )
-            session.add(task)
-            await session.commit()
-            
-            # Update schedule last_run and next_run
-            schedule.last_run = datetime.now()
-            cron = croniter(schedule.cron_expression, datetime.now())
-            schedule.next_run = cron.get_next(datetime)
+                error = get_cron_error(schedule.cron_expression)
+                if error is None:
+                    due.append(schedule)
+                else:
+                    failed_ids.append(schedule.id)
+                    logger.error(f"Error creating task for schedule {schedule.name}: {error}")
             
-            await session.commit()
-            logger.info(f"Task created for schedule {schedule.name} (task_id: {task.id})")
+            if due:
+                next_runs = await get_next_runs(
+                    [(schedule.id, schedule.cron_expression, now) for schedule in due]
+                )
+                
+                # One INSERT and one UPDATE (executemany) for the whole tick
+                await session.execute(
+                    insert(Task),
+                    [
+                        {
+                            "report_id": schedule.report_id,
+                            "schedule_id": schedule.id,
+                            "task_type": "scheduled",
+                            "priority": 0,  # Normal priority for scheduled tasks
+                            "status": "pending",
+                        }
+                        for schedule in due
+                    ]
+                )
+                await session.execute(
+                    update(Schedule),
+                    [
+                        {"id": schedule_id, "last_run": now, "next_run": next_run}
+                        for schedule_id, next_run in next_runs.items()
+                    ]
+                )
+                await session.commit()
+                
+                logger.info(
+                    f"Tasks created for {len(due)} schedules: "
+                    f"{', '.join(schedule.name for schedule in due)}"
+                )
             
-        except Exception as e:
-            logger.error(f"Error creating task for schedule {schedule.name}: {e}")
-            await session.rollback()
+            # Failed schedules stay due; leave them to the heartbeat
+            query = select(func.min(Schedule.next_run)).where(Schedule.is_active == True)
+            if failed_ids:
+                query = query.where(Schedule.id.not_in(failed_ids))
+            result = await session.execute(query)
+            return result.scalar()
     
     async def _run_report(self, report: Report, session: AsyncSession):
         """Run a specific report (legacy method for backward compatibility)."""
@@ -164,91 +199,68 @@ class Scheduler:
             
             await session.commit()
     
-    async def create_manual_task(self, report_id: int, priority: int = 1) -> int:
-        """Create a manual task for report execution."""
-        async with async_session_factory() as session:
-            result = await session.execute(
-                select(Report).where(Report.id == report_id)
-            )
-            report = result.scalar_one_or_none()
-            
-            if not report:
-                raise ValueError(f"Report with id {report_id} not found")
-            
-            # Create a manual task
-            task = Task(
+    async def _insert_manual_task(self, session: AsyncSession, report_id: int, priority: int) -> Tuple[str, int]:
+        """Insert a pending manual task and commit; returns report name and task id."""
+        result = await session.execute(
+            select(Report.name).where(Report.id == report_id)
+        )
+        report_name = result.scalar_one_or_none()
+        
+        if report_name is None:
+            raise ValueError(f"Report with id {report_id} not found")
+        
+        # Core insert: the new id comes back with the INSERT itself
+        # (lastrowid on MySQL), so no refresh query is needed
+        result = await session.execute(
+            insert(Task).values(
                 report_id=report_id,
                 schedule_id=None,
                 task_type="manual",
                 priority=priority,  # Higher priority for manual tasks
                 status="pending"
             )
-            session.add(task)
-            await session.commit()
-            await session.refresh(task)
+        )
+        await session.commit()
+        
+        return report_name, result.inserted_primary_key[0]
+    
+    async def create_manual_task(self, report_id: int, priority: int = 1) -> int:
+        """Create a manual task for report execution."""
+        async with async_session_factory() as session:
+            report_name, task_id = await self._insert_manual_task(session, report_id, priority)
             
-            logger.info(f"Manual task created for report {report.name} (task_id: {task.id})")
-            return task.id
+            logger.info(f"Manual task created for report {report_name} (task_id: {task_id})")
+            return task_id
     
     async def create_manual_task_with_file(self, report_id: int, priority: int = 1, uploaded_file=None) -> int:
         """Create a manual task for report execution with uploaded file."""
         async with async_session_factory() as session:
-            result = await session.execute(
-                select(Report).where(Report.id == report_id)
-            )
-            report = result.scalar_one_or_none()
-            
-            if not report:
-                raise ValueError(f"Report with id {report_id} not found")
-            
-            # Create a manual task
-            task = Task(
-                report_id=report_id,
-                schedule_id=None,
-                task_type="manual",
-                priority=priority,  # Higher priority for manual tasks
-                status="pending"
-            )
-            session.add(task)
-            await session.commit()
-            await session.refresh(task)
+            report_name, task_id = await self._insert_manual_task(session, report_id, priority)
             
             # Store uploaded file if provided
             if uploaded_file:
-                await self._store_uploaded_file(task.id, uploaded_file)
+                await self._store_uploaded_file(task_id, uploaded_file)
             
-            logger.info(f"Manual task created for report {report.name} with file (task_id: {task.id})")
-            return task.id
+            logger.info(f"Manual task created for report {report_name} with file (task_id: {task_id})")
+            return task_id
     
     async def create_manual_task_with_files(self, report_id: int, priority: int = 1, uploaded_files=None) -> int:
         """Create a manual task for report execution with uploaded files."""
         async with async_session_factory() as session:
-            result = await session.execute(
-                select(Report).where(Report.id == report_id)
-            )
-            report = result.scalar_one_or_none()
-            
-            if not report:
-                raise ValueError(f"Report with id {report_id} not found")
-            
-            # Create a manual task
-            task = Task(
-                report_id=report_id,
-                schedule_id=None,
-                task_type="manual",
-                priority=priority,  # Higher priority for manual tasks
-                status="pending"
-            )
-            session.add(task)
-            await session.commit()
-            await session.refresh(task)
+            report_name, task_id = await self._insert_manual_task(session, report_id, priority)
             
             # Store uploaded files if provided
             if uploaded_files:
-                await self._store_uploaded_files(task.id, uploaded_files)
+                await self._store_uploaded_files(task_id, uploaded_files)
             
-            logger.info(f"Manual task created for report {report.name} with {len(uploaded_files) if uploaded_files else 0} files (task_id: {task.id})")
-            return task.id
+            logger.info(f"Manual task created for report {report_name} with {len(uploaded_files) if uploaded_files else 0} files (task_id: {task_id})")
+            return task_id
+    
+    async def _save_upload(self, uploaded_file, file_path):
+        """Copy uploaded file to disk chunk by chunk instead of reading it whole."""
+        async with aiofiles.open(file_path, "wb") as f:
+            while chunk := await uploaded_file.read(UPLOAD_CHUNK_SIZE):
+                await f.write(chunk)
     
     async def _store_uploaded_file(self, task_id: int, uploaded_file):
         """Store uploaded file for task execution."""
@@ -265,10 +277,7 @@ class Scheduler:
             filename = f"task_{task_id}_{uploaded_file.filename}"
             file_path = uploads_dir / filename
             
-            # Write file content
-            with open(file_path, "wb") as f:
-                content = await uploaded_file.read()
-                f.write(content)
+            await self._save_upload(uploaded_file, file_path)
             
             logger.info(f"Uploaded file saved: {file_path}")
             
@@ -288,19 +297,19 @@ class Scheduler:
             uploads_dir.mkdir(parents=True, exist_ok=True)
             
             stored_files = []
+            saves = []
             for i, uploaded_file in enumerate(uploaded_files):
                 if uploaded_file and uploaded_file.filename:
                     # Save file with task_id prefix and index
                     filename = f"task_{task_id}_{i}_{uploaded_file.filename}"
                     file_path = uploads_dir / filename
-                    
-                    # Write file content
-                    with open(file_path, "wb") as f:
-                        content = await uploaded_file.read()
-                        f.write(content)
-                    
                     stored_files.append(file_path)
-                    logger.info(f"Uploaded file {i+1} saved: {file_path}")
+                    saves.append(self._save_upload(uploaded_file, file_path))
+            
+            # Write all files concurrently
+            await asyncio.gather(*saves)
+            for i, file_path in enumerate(stored_files):
+                logger.info(f"Uploaded file {i+1} saved: {file_path}")
             
             logger.info(f"Stored {len(stored_files)} files for task {task_id}")
             
@@ -38,8 +38,8 @@ class ReportResponse(ReportBase):
     model_config = ConfigDict(from_attributes=True)
 
 
-class ReportExecutionResponse(BaseModel):
-    """Schema for report execution response."""
+class ReportExecutionSummary(BaseModel):
+    """Schema for report execution without log and artifacts."""
     id: int
     report_id: int
     status: str
@@ -47,17 +47,26 @@ class ReportExecutionResponse(BaseModel):
     completed_at: Optional[datetime] = None
     error_message: Optional[str] = None
     html_output_path: Optional[str] = None
-    artifacts: Optional[List[Dict[str, str]]] = None
-    execution_log: Optional[str] = None
     
     model_config = ConfigDict(from_attributes=True)
 
 
+class ReportExecutionResponse(ReportExecutionSummary):
+    """Schema for report execution response."""
+    artifacts: Optional[List[Dict[str, str]]] = None
+    execution_log: Optional[str] = None
+
+
 class ReportWithExecutions(ReportResponse):
     """Schema for report with executions."""
     executions: List[ReportExecutionResponse] = []
 
 
+class ReportWithRecentExecutions(ReportResponse):
+    """Schema for report with its most recent executions."""
+    executions: List[ReportExecutionResponse] = Field([], validation_alias="recent_executions")
+
+
 class NotebookInfo(BaseModel):
     """Schema for notebook information."""
     name: str
@@ -133,6 +142,20 @@ class ScheduleTriggerRequest(BaseModel):
     schedule_id: int
 
 
+class CronValidateRequest(BaseModel):
+    """Schema for cron expression validation request."""
+    cron_expression: str = Field(..., min_length=1)
+
+
+class CronValidateResponse(BaseModel):
+    """Schema for cron expression validation result."""
+    valid: bool
+    next_run: Optional[datetime] = None
+    previous_run: Optional[datetime] = None
+    description: Optional[str] = None
+    error: Optional[str] = None
+
+
 # Task schemas
 class TaskBase(BaseModel):
     """Base task schema."""
@@ -1,40 +1,91 @@
 """Authentication service with LDAP support."""
 import logging
+import secrets
+import time
+from collections import OrderedDict
 from typing import Optional, Dict, Any
 from ldap3 import Server, Connection, ALL, SUBTREE
 from ldap3.core.exceptions import LDAPException
-from app.config import settings
+from app.config import get_ldap_settings, LdapSettings
 
 logger = logging.getLogger(__name__)
 
+# Session lifetime in seconds, shared with the session cookie max_age
+SESSION_TTL = 86400
+
 
 class AuthService:
     """Authentication service with LDAP support."""
     
     def __init__(self):
-        self.ldap_enabled = bool(settings.ldap_server)
+        self.ldap_enabled: Optional[bool] = None
         self.server = None
-        if self.ldap_enabled:
-            self._setup_ldap_server()
+        # In-memory session store: session_id -> (expires_at, user_info).
+        # Expiry uses the monotonic clock (the one asyncio schedules on),
+        # so wall-clock adjustments cannot extend or cut short sessions.
+        # With a fixed TTL insertion order is expiry order, oldest first.
+        self.sessions: "OrderedDict[str, tuple]" = OrderedDict()
+    
+    @property
+    def ldap_settings(self) -> LdapSettings:
+        """LDAP settings, loaded lazily on first access."""
+        return get_ldap_settings()
     
     def _setup_ldap_server(self):
         """Setup LDAP server connection."""
         try:
             self.server = Server(
-                settings.ldap_server,
-                port=settings.ldap_port,
-                use_ssl=settings.ldap_use_ssl,
+                self.ldap_settings.ldap_server,
+                port=self.ldap_settings.ldap_port,
+                use_ssl=self.ldap_settings.ldap_use_ssl,
                 get_info=ALL
             )
-            logger.info(f"LDAP server configured: {settings.ldap_server}:{settings.ldap_port}")
+            logger.info(f"LDAP server configured: {self.ldap_settings.ldap_server}:{self.ldap_settings.ldap_port}")
         except Exception as e:
             logger.error(f"Failed to setup LDAP server: {e}")
             self.ldap_enabled = False
     
     def is_ldap_enabled(self) -> bool:
         """Check if LDAP authentication is enabled."""
+        if self.ldap_enabled is None:
+            self.ldap_enabled = bool(self.ldap_settings.ldap_server)
+            if self.ldap_enabled:
+                self._setup_ldap_server()
         return self.ldap_enabled
     
+    def create_session(self, user_info: Dict[str, Any]) -> str:
+        """Create a server-side session and return its id."""
+        now = time.monotonic()
+        self._purge_expired(now)
+        session_id = secrets.token_urlsafe(32)
+        self.sessions[session_id] = (now + SESSION_TTL, user_info)
+        return session_id
+    
+    def _purge_expired(self, now: float):
+        """Drop expired sessions; browsers discard the cookie, so nobody looks them up again."""
+        while self.sessions:
+            expires_at, _ = next(iter(self.sessions.values()))
+            if expires_at > now:
+                break
+            self.sessions.popitem(last=False)
+    
+    def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Get user info for a session, evicting it if expired."""
+        session = self.sessions.get(session_id)
+        if session is None:
+            return None
+        
+        expires_at, user_info = session
+        if time.monotonic() >= expires_at:
+            self.sessions.pop(session_id, None)
+            return None
+        
+        return user_info
+    
+    def delete_session(self, session_id: str):
+        """Delete a server-side session."""
+        self.sessions.pop(session_id, None)
+    
     def authenticate(self, username: str, password: str) -> Optional[Dict[str, Any]]:
         """
         Authenticate user with LDAP or allow access without authentication.
@@ -46,7 +97,7 @@ class AuthService:
         Returns:
             User info dict if authentication successful, None otherwise
         """
-        if not self.ldap_enabled:
+        if not self.is_ldap_enabled():
             # No LDAP configured, allow access without authentication
             logger.info(f"LDAP not configured, allowing access for user: {username}")
             return {
@@ -74,12 +125,12 @@ class AuthService:
         
         try:
             # Method 1: Direct bind with user DN template
-            if settings.ldap_user_dn_template:
-                user_dn = settings.ldap_user_dn_template.format(username=username)
+            if self.ldap_settings.ldap_user_dn_template:
+                user_dn = self.ldap_settings.ldap_user_dn_template.format(username=username)
                 return self._direct_bind_auth(user_dn, password, username)
             
             # Method 2: Search and bind
-            if settings.ldap_user_search_base and settings.ldap_user_search_filter:
+            if self.ldap_settings.ldap_user_search_base and self.ldap_settings.ldap_user_search_filter:
                 return self._search_bind_auth(username, password)
             
             logger.error("LDAP configuration incomplete: missing user_dn_template or user_search settings")
@@ -114,11 +165,11 @@ class AuthService:
         try:
             # First, bind with service account to search for user
             service_conn = None
-            if settings.ldap_bind_dn and settings.ldap_bind_password:
+            if self.ldap_settings.ldap_bind_dn and self.ldap_settings.ldap_bind_password:
                 service_conn = Connection(
                     self.server,
-                    user=settings.ldap_bind_dn,
-                    password=settings.ldap_bind_password,
+                    user=self.ldap_settings.ldap_bind_dn,
+                    password=self.ldap_settings.ldap_bind_password,
                     auto_bind=True
                 )
             else:
@@ -126,9 +177,9 @@ class AuthService:
                 service_conn = Connection(self.server, auto_bind=True)
             
             # Search for user
-            search_filter = settings.ldap_user_search_filter.format(username=username)
+            search_filter = self.ldap_settings.ldap_user_search_filter.format(username=username)
             service_conn.search(
-                search_base=settings.ldap_user_search_base,
+                search_base=self.ldap_settings.ldap_user_search_base,
                 search_filter=search_filter,
                 search_scope=SUBTREE,
                 attributes=['*']
@@ -183,7 +234,7 @@ class AuthService:
             
             # Get user groups if configured
             groups = []
-            if settings.ldap_group_search_base and settings.ldap_group_search_filter:
+            if self.ldap_settings.ldap_group_search_base and self.ldap_settings.ldap_group_search_filter:
                 groups = self._get_user_groups(conn, user_dn)
             
             return {
@@ -209,9 +260,9 @@ class AuthService:
     def _get_user_groups(self, conn: Connection, user_dn: str) -> list:
         """Get user groups from LDAP."""
         try:
-            search_filter = settings.ldap_group_search_filter.format(user_dn=user_dn)
+            search_filter = self.ldap_settings.ldap_group_search_filter.format(user_dn=user_dn)
             conn.search(
-                search_base=settings.ldap_group_search_base,
+                search_base=self.ldap_settings.ldap_group_search_base,
                 search_filter=search_filter,
                 search_scope=SUBTREE,
                 attributes=['cn', 'name']
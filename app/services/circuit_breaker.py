@@ -0,0 +1,64 @@
+"""Circuit breaker for database reads with stale-cache fallback."""
+import logging
+import time
+from typing import Any, Optional
+from litestar.exceptions import ServiceUnavailableException
+from litestar.response import Response
+from sqlalchemy.exc import OperationalError, TimeoutError as PoolTimeoutError
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Errors meaning the database is unreachable or overloaded, not a bad query
+DB_UNAVAILABLE_ERRORS = (OperationalError, PoolTimeoutError)
+
+
+class CircuitBreaker:
+    """Stop sending reads to the database for a while after repeated failures."""
+    
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+    
+    def allow_request(self) -> bool:
+        """Check whether a call may go to the database."""
+        if self._opened_at is None:
+            return True
+        
+        if time.monotonic() - self._opened_at < self.reset_timeout:
+            return False
+        
+        # Half-open: this call probes the database, others wait for its result
+        self._opened_at = time.monotonic()
+        return True
+    
+    def record_success(self) -> None:
+        """Close the breaker after a successful call."""
+        if self._opened_at is not None:
+            logger.info("Database reachable again, closing circuit breaker")
+        self._failures = 0
+        self._opened_at = None
+    
+    def record_failure(self) -> None:
+        """Count a failed call, opening the breaker at the threshold."""
+        self._failures += 1
+        if self._failures >= self.failure_threshold:
+            if self._opened_at is None:
+                logger.warning(f"Database unavailable, opening circuit breaker for {self.reset_timeout}s")
+            self._opened_at = time.monotonic()
+
+
+def stale_response(value: Any) -> Response:
+    """Serve last known good value, or 503 when there is none."""
+    if value is None:
+        raise ServiceUnavailableException(detail="Database is unavailable")
+    return Response(content=value, headers={"x-stale-cache": "true"})
+
+
+# Global database circuit breaker instance
+db_circuit_breaker = CircuitBreaker(
+    failure_threshold=settings.db_breaker_failure_threshold,
+    reset_timeout=settings.db_breaker_reset_timeout
+)
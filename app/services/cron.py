@@ -0,0 +1,54 @@
+"""Cron expression helpers."""
+import asyncio
+import copy
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Optional, Sequence, Tuple
+from croniter import croniter
+
+# Batches at least this large are computed in a worker thread
+NEXT_RUNS_THREAD_THRESHOLD = 8
+
+
+@lru_cache(maxsize=512)
+def _parse_cron(cron_expression: str) -> croniter:
+    """Parse cron expression once; raises for invalid expressions."""
+    return croniter(cron_expression, datetime(2000, 1, 1))
+
+
+@lru_cache(maxsize=1024)
+def get_cron_error(cron_expression: str) -> Optional[str]:
+    """Get error message for invalid cron expression, None if it is valid."""
+    try:
+        _parse_cron(cron_expression)
+    except Exception as e:
+        return str(e)
+    return None
+
+
+def get_cron(cron_expression: str, start_time: datetime) -> croniter:
+    """Get croniter for expression positioned at start_time."""
+    # Copy the cached parse result; only the current position differs
+    cron = copy.copy(_parse_cron(cron_expression))
+    cron.set_current(start_time, force=True)
+    return cron
+
+
+def get_next_run(cron_expression: str, start_time: datetime) -> datetime:
+    """Get next run time after start_time."""
+    return get_cron(cron_expression, start_time).get_next(datetime)
+
+
+def _compute_next_runs(items: Sequence[Tuple[int, str, datetime]]) -> Dict[int, datetime]:
+    """Compute next run times for (id, cron_expression, start_time) items."""
+    return {
+        item_id: get_next_run(cron_expression, start_time)
+        for item_id, cron_expression, start_time in items
+    }
+
+
+async def get_next_runs(items: Sequence[Tuple[int, str, datetime]]) -> Dict[int, datetime]:
+    """Get next run times by id, off the event loop for large batches."""
+    if len(items) < NEXT_RUNS_THREAD_THRESHOLD:
+        return _compute_next_runs(items)
+    return await asyncio.to_thread(_compute_next_runs, items)
@@ -0,0 +1,71 @@
+"""In-memory cache of rendered notebook HTML outputs."""
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple
+import aiofiles
+import aiofiles.os
+from app.config import settings
+
+# Upper bound for cached HTML outputs (characters, roughly bytes)
+HTML_CACHE_MAX_SIZE = 64 * 1024 * 1024
+
+
+class HtmlCache:
+    """LRU cache of HTML output files, validated by mtime and size."""
+    
+    def __init__(self, max_size: int, auto_reload: bool = True):
+        self.max_size = max_size
+        # Without auto_reload cached files are never stat()ed again;
+        # execution outputs are written once into their own directory
+        self.auto_reload = auto_reload
+        self._entries: "OrderedDict[str, Tuple[os.stat_result, str]]" = OrderedDict()
+        self._size = 0
+    
+    async def stat(self, path: Path) -> os.stat_result:
+        """Get file stat, from the cache when auto_reload is off."""
+        if not self.auto_reload:
+            entry = self._entries.get(str(path))
+            if entry is not None:
+                return entry[0]
+        return await aiofiles.os.stat(path)
+    
+    async def get(self, path: Path, stat: Optional[os.stat_result] = None) -> str:
+        """Get file content without blocking the event loop."""
+        if stat is None:
+            stat = await self.stat(path)
+        
+        key = str(path)
+        entry = self._entries.get(key)
+        if (
+            entry is not None
+            and entry[0].st_mtime_ns == stat.st_mtime_ns
+            and entry[0].st_size == stat.st_size
+        ):
+            self._entries.move_to_end(key)
+            return entry[1]
+        
+        async with aiofiles.open(path, 'r', encoding='utf-8') as f:
+            content = await f.read()
+        
+        self._store(key, stat, content)
+        return content
+    
+    def _store(self, key: str, stat: os.stat_result, content: str) -> None:
+        """Add file content, evicting least recently used files over the limit."""
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._size -= len(old[1])
+        
+        if len(content) > self.max_size:
+            return
+        
+        self._entries[key] = (stat, content)
+        self._size += len(content)
+        while self._size > self.max_size:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+
+# Global HTML cache instance
+html_cache = HtmlCache(HTML_CACHE_MAX_SIZE, auto_reload=settings.html_cache_auto_reload)
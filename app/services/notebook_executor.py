@@ -8,8 +8,11 @@ import shutil
 import subprocess
 import tempfile
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any, Optional
+import aiofiles
+import aiofiles.os
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -18,6 +21,9 @@ logger = logging.getLogger(__name__)
 class NotebookExecutor:
     """Service for executing Jupyter notebooks."""
 
+    # File in executions/<report>/ pointing at the latest HTML output
+    LATEST_HTML_POINTER = ".latest_html"
+
     def __init__(self):
         self.notebooks_path = Path(settings.jupyter_notebooks_path)
         self.output_path = Path(settings.jupyter_output_path)
@@ -181,6 +187,12 @@ class NotebookExecutor:
                     except Exception as e:
                         logger.warning(f"Failed to copy to legacy location {legacy_path}: {e}")
 
+            self._update_latest_html_pointer(
+                report_name,
+                execution_datetime,
+                Path(final_html_path).name if final_html_path else None
+            )
+
             # Prepare result
             result = {
                 "html_path": final_html_path,
@@ -203,6 +215,58 @@ class NotebookExecutor:
                 shutil.rmtree(temp_execution_dir)
                 logger.info(f"Cleaned up temporary directory: {temp_execution_dir}")
 
+    def _update_latest_html_pointer(self, report_name: str, execution_datetime: str, html_filename: Optional[str]):
+        """Point report at HTML output of its latest execution (remove pointer if there is none)."""
+        pointer_path = self.executions_output_path / report_name / self.LATEST_HTML_POINTER
+
+        try:
+            # Runs of the same report can finish out of order; an older one must not
+            # replace the pointer (execution datetimes sort lexicographically)
+            try:
+                current = pointer_path.read_text(encoding="utf-8").strip()
+            except FileNotFoundError:
+                current = ""
+            if current.partition("/")[0] > execution_datetime:
+                return
+
+            if html_filename:
+                # Write a uniquely named temp file then rename, so readers never see
+                # a partial pointer and concurrent runs never share a temp file
+                with tempfile.NamedTemporaryFile(
+                    "w",
+                    encoding="utf-8",
+                    dir=pointer_path.parent,
+                    prefix=f"{self.LATEST_HTML_POINTER}.",
+                    suffix=".tmp",
+                    delete=False
+                ) as temp_pointer:
+                    temp_pointer.write(f"{execution_datetime}/{html_filename}")
+                try:
+                    os.replace(temp_pointer.name, pointer_path)
+                except OSError:
+                    os.unlink(temp_pointer.name)
+                    raise
+            else:
+                pointer_path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Failed to update latest HTML pointer for {report_name}: {e}")
+
+    async def get_latest_html_path(self, report_name: str) -> Optional[Path]:
+        """Get HTML output of the latest execution of a report, None if unknown."""
+        report_dir = self.executions_output_path / report_name
+
+        try:
+            async with aiofiles.open(report_dir / self.LATEST_HTML_POINTER, 'r', encoding='utf-8') as f:
+                relative_path = (await f.read()).strip()
+        except OSError:
+            return None
+
+        html_path = report_dir / relative_path
+        if not relative_path or not await aiofiles.os.path.isfile(html_path):
+            return None
+
+        return html_path
+
     def _copy_notebook_to_temp_dir(self, notebook_path: Path, temp_dir: Path, variables: dict = None) -> Path:
         """
         Copy notebook to temporary directory and add warning suppression code.
@@ -504,8 +568,12 @@ class NotebookExecutor:
         artifacts = []
 
         # Collect ALL files from output directory (except .ipynb files)
-        for file_path in output_dir.iterdir():
-            if file_path.is_file() and file_path.suffix != ".ipynb":
+        # scandir: file type comes with the directory entry, no stat per file
+        with os.scandir(output_dir) as entries:
+            file_paths = [Path(entry.path) for entry in entries if entry.is_file()]
+
+        for file_path in file_paths:
+            if file_path.suffix != ".ipynb":
                 # Determine file type and description
                 file_type = "file"
                 description = f"File: {file_path.name}"
@@ -549,11 +617,12 @@ class NotebookExecutor:
                 continue
 
             relative_path = notebook_path.relative_to(self.notebooks_path)
+            stat = notebook_path.stat()
             notebooks.append({
                 "name": notebook_path.stem,
                 "path": str(relative_path),
-                "size": notebook_path.stat().st_size,
-                "modified": datetime.fromtimestamp(notebook_path.stat().st_mtime)
+                "size": stat.st_size,
+                "modified": datetime.fromtimestamp(stat.st_mtime)
             })
 
         return notebooks
@@ -576,25 +645,33 @@ class NotebookExecutor:
             report_name = notebook_path.stem
             report_output_dir = self.reports_output_path / report_name
 
-            # Get latest execution info
+            # Get latest execution info from a single pass over the output directory
             latest_execution = None
+            has_output = False
             if report_output_dir.exists():
-                html_files = list(report_output_dir.glob("*.html"))
-                if html_files:
-                    # Get the most recent HTML file
-                    latest_html = max(html_files, key=lambda f: f.stat().st_mtime)
+                latest_html = None
+                latest_mtime = 0.0
+                with os.scandir(report_output_dir) as entries:
+                    for entry in entries:
+                        has_output = True
+                        if entry.name.endswith(".html") and entry.is_file():
+                            mtime = entry.stat().st_mtime
+                            if latest_html is None or mtime > latest_mtime:
+                                latest_html, latest_mtime = entry.path, mtime
+                if latest_html is not None:
                     latest_execution = {
-                        "html_path": str(latest_html),
-                        "executed_at": datetime.fromtimestamp(latest_html.stat().st_mtime)
+                        "html_path": latest_html,
+                        "executed_at": datetime.fromtimestamp(latest_mtime)
                     }
 
+            stat = notebook_path.stat()
             reports.append({
                 "name": notebook_path.stem,
                 "path": str(relative_path),
-                "size": notebook_path.stat().st_size,
-                "modified": datetime.fromtimestamp(notebook_path.stat().st_mtime),
+                "size": stat.st_size,
+                "modified": datetime.fromtimestamp(stat.st_mtime),
                 "latest_execution": latest_execution,
-                "has_output": report_output_dir.exists() and any(report_output_dir.iterdir())
+                "has_output": has_output
             })
 
         return reports
@@ -609,37 +686,25 @@ class NotebookExecutor:
         Returns:
             List of variable information with name, default_value, and description
         """
-        import json
-
-        variables = []
+        full_notebook_path = self.notebooks_path / notebook_path
 
         try:
-            full_notebook_path = self.notebooks_path / notebook_path
-
-            if not full_notebook_path.exists():
-                logger.warning(f"Notebook not found: {full_notebook_path}")
-                return variables
-
-            with open(full_notebook_path, 'r', encoding='utf-8') as f:
-                notebook = json.load(f)
-
-            for cell in notebook.get("cells", []):
-                if cell.get("cell_type") == "code":
-                    source = cell.get("source", [])
-                    cell_text = "".join(source)
-
-                    # Scan for os.getenv() calls
-                    self._scan_os_getenv_variables(cell_text, variables)
-
-                    # Scan for Colab @param annotations
-                    self._scan_colab_params(cell_text, variables)
-
-            logger.info(f"Found {len(variables)} variables in notebook {notebook_path}: {[v['name'] for v in variables]}")
+            stat = full_notebook_path.stat()
+        except OSError:
+            logger.warning(f"Notebook not found: {full_notebook_path}")
+            return []
 
+        try:
+            # Keyed by file version, so an edited notebook is scanned again
+            variables = _scan_notebook_file(
+                str(full_notebook_path), stat.st_mtime_ns, stat.st_size
+            )
         except Exception as e:
             logger.error(f"Error scanning notebook {notebook_path} for variables: {e}")
+            return []
 
-        return variables
+        # Copies, so callers cannot modify the cached result
+        return [dict(variable) for variable in variables]
 
     def _scan_os_getenv_variables(self, cell_text: str, variables: List[Dict[str, str]]):
         """Scan for os.getenv() calls in cell text."""
@@ -849,3 +914,31 @@ class NotebookExecutor:
             return "email"
 
         return "text"
+
+
+# Global notebook executor instance
+notebook_executor = NotebookExecutor()
+
+
+@lru_cache(maxsize=256)
+def _scan_notebook_file(full_notebook_path: str, mtime_ns: int, size: int) -> List[Dict[str, str]]:
+    """Parse notebook file and collect its variables."""
+    variables = []
+
+    with open(full_notebook_path, 'r', encoding='utf-8') as f:
+        notebook = json.load(f)
+
+    for cell in notebook.get("cells", []):
+        if cell.get("cell_type") == "code":
+            source = cell.get("source", [])
+            cell_text = "".join(source)
+
+            # Scan for os.getenv() calls
+            notebook_executor._scan_os_getenv_variables(cell_text, variables)
+
+            # Scan for Colab @param annotations
+            notebook_executor._scan_colab_params(cell_text, variables)
+
+    logger.info(f"Found {len(variables)} variables in notebook {full_notebook_path}: {[v['name'] for v in variables]}")
+
+    return variables
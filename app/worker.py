@@ -4,11 +4,12 @@ import logging
 from datetime import datetime
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func
 from sqlalchemy.orm import selectinload
-from app.database import async_session_factory
+from app.database import async_session_factory, database_ready
 from app.models import Task, Report, ReportExecution, Schedule
-from app.services.notebook_executor import NotebookExecutor
+from app.services.cron import get_next_run
+from app.services.notebook_executor import notebook_executor
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +18,7 @@ class TaskWorker:
     """Background worker for processing tasks from the queue."""
     
     def __init__(self):
-        self.executor = NotebookExecutor()
+        self.executor = notebook_executor
         self.running = False
         self._task = None
         self.active_tasks = set()  # Track actively running task IDs
@@ -48,6 +49,7 @@ class TaskWorker:
     
     async def _worker_loop(self):
         """Main worker loop."""
+        await database_ready.wait()
         while self.running:
             try:
                 # First, check for stuck tasks and mark them as failed
@@ -170,9 +172,7 @@ class TaskWorker:
             # Update schedule if this was a scheduled task
             if task.schedule_id and task.schedule:
                 task.schedule.last_run = datetime.now()
-                from croniter import croniter
-                cron = croniter(task.schedule.cron_expression, datetime.now())
-                task.schedule.next_run = cron.get_next(datetime)
+                task.schedule.next_run = get_next_run(task.schedule.cron_expression, datetime.now())
             
             await session.commit()
             logger.info(f"Task {task.id} completed successfully")
@@ -213,20 +213,17 @@ class TaskWorker:
     async def get_queue_status(self) -> dict:
         """Get current queue status."""
         async with async_session_factory() as session:
-            # Count tasks by status
-            pending_result = await session.execute(
-                select(Task).where(Task.status == "pending")
-            )
-            pending_count = len(pending_result.scalars().all())
-            
-            running_result = await session.execute(
-                select(Task).where(Task.status == "running")
+            # Count tasks by status in the database instead of loading them
+            result = await session.execute(
+                select(Task.status, func.count())
+                .where(Task.status.in_(["pending", "running"]))
+                .group_by(Task.status)
             )
-            running_count = len(running_result.scalars().all())
+            counts = dict(result.all())
             
             return {
-                "pending": pending_count,
-                "running": running_count,
+                "pending": counts.get("pending", 0),
+                "running": counts.get("running", 0),
                 "worker_running": self.running
             }
 